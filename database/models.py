@@ -5,17 +5,21 @@ Contains the Task class that handles all CRUD operations for tasks.
 """
 
 import sqlite3
+import threading
 from contextlib import contextmanager
-from typing import List, Tuple, Optional, Generator
+from typing import List, Optional, Generator
 from .connection import get_db_path
 
+# UPDATE ... RETURNING needs SQLite 3.35+; older builds take two statements
+_HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+
 
 class TaskRepository:
     """
     Repository for managing tasks in the database.
 
     Handles all database operations for creating, reading, updating, and deleting tasks.
-    Uses SQLite for persistence.
+    Uses SQLite for persistence, with one long-lived connection per thread.
     """
 
     def __init__(self, db_path: Optional[str] = None) -> None:
@@ -26,6 +30,7 @@ class TaskRepository:
             db_path: Path to the SQLite database file. If None, uses default path.
         """
         self.db_path = db_path or get_db_path("tasks.db")
+        self._local = threading.local()
         self._init_db()
 
     @contextmanager
@@ -36,24 +41,45 @@ class TaskRepository:
         Provides automatic transaction management:
         - Commits on success
         - Rolls back on exception
-        - Always closes connection
 
-        This prioritizes simplicity and thread-safety over micro-optimization.
-        SQLite connection overhead (~1ms) is negligible compared to LLM
-        latency (~500ms) in this application.
+        The connection is reused across calls on the same thread (see
+        _thread_connection), so repeated operations skip the connect cost and
+        hit sqlite3's per-connection prepared statement cache.
 
         Yields:
             sqlite3.Connection: Database connection
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = self._thread_connection()
         try:
             yield conn
             conn.commit()
         except Exception:
             conn.rollback()
             raise
-        finally:
+
+    def _thread_connection(self) -> sqlite3.Connection:
+        """
+        Return this thread's connection, opening it on first use.
+
+        sqlite3 connections must not be shared across threads, so each thread
+        gets its own. The default rollback journal is kept (no WAL) so every
+        committed write lands in the main database file, which is what the
+        Cloud Storage sync uploads.
+        """
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path)
+            # Rows support access by column name as well as by index
+            conn.row_factory = sqlite3.Row
+            self._local.conn = conn
+        return conn
+
+    def close(self) -> None:
+        """Close the current thread's connection, if one is open."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
             conn.close()
+            self._local.conn = None
 
     def _init_db(self) -> None:
         """
@@ -124,7 +150,7 @@ class TaskRepository:
             assert task_id is not None, "Failed to create task: lastrowid is None"
             return task_id
 
-    def get_user_tasks(self, user_id: str, done: bool = False) -> List[Tuple]:
+    def get_user_tasks(self, user_id: str, done: bool = False) -> List[sqlite3.Row]:
         """
         Get all tasks for a specific user.
 
@@ -133,7 +159,7 @@ class TaskRepository:
             done: Filter by done status (False = incomplete, True = completed)
 
         Returns:
-            List of tuples: (id, description, done, created_at, due_date, calendar_event_id, timezone)
+            List of rows: (id, description, done, created_at, due_date, calendar_event_id, timezone)
         """
         with self.get_connection() as conn:
             cursor = conn.cursor()
@@ -144,6 +170,25 @@ class TaskRepository:
             tasks = cursor.fetchall()
             return tasks
 
+    def count_user_tasks(self, user_id: str, done: bool = False) -> int:
+        """
+        Count tasks for a specific user without fetching the rows.
+
+        Args:
+            user_id: The ID of the user
+            done: Filter by done status (False = incomplete, True = completed)
+
+        Returns:
+            Number of matching tasks
+        """
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                "SELECT COUNT(*) FROM tasks WHERE user_id = ? AND done = ?",
+                (user_id, done)
+            )
+            return cursor.fetchone()[0]
+
     def mark_task_done(self, task_id: int, user_id: str) -> bool:
         """
         Mark a task as completed.
@@ -201,7 +246,7 @@ class TaskRepository:
             rows_affected = cursor.rowcount
             return rows_affected > 0
 
-    def get_scheduled_tasks(self, user_id: str, done: bool = False) -> List[Tuple]:
+    def get_scheduled_tasks(self, user_id: str, done: bool = False) -> List[sqlite3.Row]:
         """
         Get all tasks with due dates (scheduled tasks) for a specific user.
 
@@ -210,7 +255,7 @@ class TaskRepository:
             done: Filter by done status (False = incomplete, True = completed)
 
         Returns:
-            List of tuples: (id, description, done, created_at, due_date, calendar_event_id, timezone)
+            List of rows: (id, description, done, created_at, due_date, calendar_event_id, timezone)
             Ordered by due_date ascending (earliest first)
         """
         with self.get_connection() as conn:
@@ -222,7 +267,7 @@ class TaskRepository:
             tasks = cursor.fetchall()
             return tasks
 
-    def get_task_by_id(self, task_id: int, user_id: str) -> Optional[Tuple]:
+    def get_task_by_id(self, task_id: int, user_id: str) -> Optional[sqlite3.Row]:
         """
         Get a specific task by ID.
 
@@ -231,7 +276,7 @@ class TaskRepository:
             user_id: The ID of the user (for security)
 
         Returns:
-            Tuple: (id, description, done, created_at, due_date, calendar_event_id, timezone)
+            Row: (id, description, done, created_at, due_date, calendar_event_id, timezone)
             or None if not found
         """
         with self.get_connection() as conn:
@@ -242,3 +287,40 @@ class TaskRepository:
             )
             task = cursor.fetchone()
             return task
+
+    def mark_task_done_by_number(self, user_id: str, task_number: int) -> Optional[sqlite3.Row]:
+        """
+        Mark an incomplete task as done by its 1-indexed position in the task list.
+
+        Resolves the position and updates the row in a single statement, using
+        the same ordering as get_user_tasks() so task_number matches list_tasks.
+
+        Args:
+            user_id: The ID of the user
+            task_number: 1-indexed position in the incomplete task list
+
+        Returns:
+            Row: (id, description, calendar_event_id) of the completed task,
+            or None if there is no task at that position
+        """
+        # SQLite treats a negative OFFSET as zero, so guard explicitly
+        if task_number < 1:
+            return None
+
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            if _HAS_RETURNING:
+                cursor.execute(
+                    "UPDATE tasks SET done = 1 WHERE id = (SELECT id FROM tasks WHERE user_id = ? AND done = 0 ORDER BY created_at LIMIT 1 OFFSET ?) RETURNING id, description, calendar_event_id",
+                    (user_id, task_number - 1)
+                )
+                return cursor.fetchone()
+
+            cursor.execute(
+                "SELECT id, description, calendar_event_id FROM tasks WHERE user_id = ? AND done = 0 ORDER BY created_at LIMIT 1 OFFSET ?",
+                (user_id, task_number - 1)
+            )
+            task = cursor.fetchone()
+            if task is not None:
+                cursor.execute("UPDATE tasks SET done = 1 WHERE id = ?", (task[0],))
+            return task
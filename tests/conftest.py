@@ -7,6 +7,7 @@ Provides reusable test fixtures for database, mocks, and test data.
 import os
 import sqlite3
 import tempfile
+from concurrent.futures import Future
 from datetime import datetime, timezone
 from unittest.mock import Mock, MagicMock
 
@@ -47,7 +48,8 @@ def task_repo(test_db_path):
     Uses a temporary SQLite database that's cleaned up after each test.
     """
     repo = TaskRepository(db_path=test_db_path)
-    return repo
+    yield repo
+    repo.close()
 
 
 @pytest.fixture
@@ -129,6 +131,29 @@ def mock_datetime():
     return datetime(2025, 1, 15, 10, 0, 0, tzinfo=timezone.utc)
 
 
+class _InlineExecutor:
+    """Executor stand-in that runs submitted work immediately on the caller's thread."""
+
+    def submit(self, fn, *args, **kwargs):
+        future = Future()
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+
+
+@pytest.fixture(autouse=True)
+def inline_calendar_executor(monkeypatch):
+    """
+    Run background Google Calendar work inline.
+
+    Keeps tests deterministic: calendar calls made via the tools' executor
+    have completed by the time the tool returns.
+    """
+    monkeypatch.setattr('tools.tasks._CAL_EXECUTOR', _InlineExecutor())
+
+
 @pytest.fixture(autouse=True)
 def reset_environment():
     """
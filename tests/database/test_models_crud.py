@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import datetime as dt
+import threading
 
 import pytz
 
@@ -82,6 +83,31 @@ def test_get_task_by_id_returns_tuple(tmp_path) -> None:
     assert repo.get_task_by_id(task_id, "other-user") is None
 
 
+def test_mark_task_done_by_number_updates_and_returns_row(tmp_path) -> None:
+    repo = _repo(tmp_path)
+    first_id = repo.create_task("user-1", "First task")
+    second_id = repo.create_task("user-1", "Second task")
+    repo.update_calendar_event_id(second_id, "user-1", "event-2")
+
+    assert tuple(repo.mark_task_done_by_number("user-1", 2)) == (second_id, "Second task", "event-2")
+    assert repo.mark_task_done_by_number("user-1", 2) is None
+    assert repo.mark_task_done_by_number("user-1", 0) is None
+    assert repo.mark_task_done_by_number("other-user", 1) is None
+    assert [task[0] for task in repo.get_user_tasks("user-1")] == [first_id]
+
+
+def test_count_user_tasks_filters_by_status(tmp_path) -> None:
+    repo = _repo(tmp_path)
+    first_id = repo.create_task("user-1", "First task")
+    repo.create_task("user-1", "Second task")
+    repo.create_task("user-2", "Other user's task")
+    repo.mark_task_done(first_id, "user-1")
+
+    assert repo.count_user_tasks("user-1") == 1
+    assert repo.count_user_tasks("user-1", done=True) == 1
+    assert repo.count_user_tasks("nobody") == 0
+
+
 def test_clear_all_tasks_deletes_records(tmp_path) -> None:
     repo = _repo(tmp_path)
     repo.create_task("user-1", "Task A")
@@ -90,3 +116,21 @@ def test_clear_all_tasks_deletes_records(tmp_path) -> None:
     deleted_count = repo.clear_all_tasks("user-1")
     assert deleted_count == 2
     assert repo.get_user_tasks("user-1") == []
+
+
+def test_connection_is_reused_per_thread(tmp_path) -> None:
+    repo = _repo(tmp_path)
+
+    with repo.get_connection() as first, repo.get_connection() as second:
+        assert first is second
+
+    other_thread: list = []
+    worker = threading.Thread(target=lambda: other_thread.append(repo._thread_connection()))
+    worker.start()
+    worker.join()
+
+    assert other_thread[0] is not first
+
+    repo.close()
+    with repo.get_connection() as reopened:
+        assert reopened is not first
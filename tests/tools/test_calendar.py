@@ -64,13 +64,12 @@ class TestListCalendarEvents:
                 return _stub_datetime_end()
             return _stub_datetime_now()
 
-        monkeypatch.setattr("utils.date_parser.parse_natural_language_date", mock_parse)
+        monkeypatch.setattr(tasks, "parse_natural_language_date", mock_parse)
 
         # Mock Google Calendar API call
-        from tools import google_calendar
         monkeypatch.setattr(
-            google_calendar,
-            "list_calendar_events",
+            tasks,
+            "get_calendar_events",
             lambda start, end: mock_events
         )
 
@@ -102,13 +101,12 @@ class TestListCalendarEvents:
                 return _stub_datetime_start()
             return _stub_datetime_end()
 
-        monkeypatch.setattr("utils.date_parser.parse_natural_language_date", mock_parse)
+        monkeypatch.setattr(tasks, "parse_natural_language_date", mock_parse)
 
         # Mock empty calendar
-        from tools import google_calendar
         monkeypatch.setattr(
-            google_calendar,
-            "list_calendar_events",
+            tasks,
+            "get_calendar_events",
             lambda start, end: []
         )
 
@@ -140,12 +138,11 @@ class TestListCalendarEvents:
                 return _stub_datetime_start()
             return _stub_datetime_end()
 
-        monkeypatch.setattr("utils.date_parser.parse_natural_language_date", mock_parse)
+        monkeypatch.setattr(tasks, "parse_natural_language_date", mock_parse)
 
-        from tools import google_calendar
         monkeypatch.setattr(
-            google_calendar,
-            "list_calendar_events",
+            tasks,
+            "get_calendar_events",
             lambda start, end: mock_events
         )
 
@@ -167,16 +164,15 @@ class TestListCalendarEvents:
                 return _stub_datetime_start()
             return _stub_datetime_end()
 
-        monkeypatch.setattr("utils.date_parser.parse_natural_language_date", mock_parse)
+        monkeypatch.setattr(tasks, "parse_natural_language_date", mock_parse)
 
         # Mock calendar service to raise FileNotFoundError
-        from tools import google_calendar
         def mock_list_events(start, end):
             raise FileNotFoundError("credentials.json not found")
 
         monkeypatch.setattr(
-            google_calendar,
-            "list_calendar_events",
+            tasks,
+            "get_calendar_events",
             mock_list_events
         )
 
@@ -196,16 +192,15 @@ class TestListCalendarEvents:
                 return _stub_datetime_start()
             return _stub_datetime_end()
 
-        monkeypatch.setattr("utils.date_parser.parse_natural_language_date", mock_parse)
+        monkeypatch.setattr(tasks, "parse_natural_language_date", mock_parse)
 
         # Mock calendar service to raise generic error
-        from tools import google_calendar
         def mock_list_events(start, end):
             raise Exception("API quota exceeded")
 
         monkeypatch.setattr(
-            google_calendar,
-            "list_calendar_events",
+            tasks,
+            "get_calendar_events",
             mock_list_events
         )
 
@@ -239,12 +234,11 @@ class TestListCalendarEvents:
                 return None  # Triggers fallback
             return _stub_datetime_end()
 
-        monkeypatch.setattr("utils.date_parser.parse_natural_language_date", mock_parse)
+        monkeypatch.setattr(tasks, "parse_natural_language_date", mock_parse)
 
-        from tools import google_calendar
         monkeypatch.setattr(
-            google_calendar,
-            "list_calendar_events",
+            tasks,
+            "get_calendar_events",
             lambda start, end: mock_events
         )
 
@@ -268,12 +262,11 @@ class TestListCalendarEvents:
             parse_calls.append((date_str, tz))
             return _stub_datetime_start() if date_str == "today" else _stub_datetime_end()
 
-        monkeypatch.setattr("utils.date_parser.parse_natural_language_date", mock_parse)
+        monkeypatch.setattr(tasks, "parse_natural_language_date", mock_parse)
 
-        from tools import google_calendar
         monkeypatch.setattr(
-            google_calendar,
-            "list_calendar_events",
+            tasks,
+            "get_calendar_events",
             lambda start, end: []
         )
 
@@ -287,3 +280,14 @@ class TestListCalendarEvents:
         # Verify timezone was passed to date parser
         assert parse_calls[0][1] == "America/New_York"
         assert parse_calls[1][1] == "America/New_York"
+
+
+def test_week_bounds_span_today_to_end_of_sunday() -> None:
+    wednesday = dt.date(2025, 3, 5).toordinal()
+
+    start, end = tasks._week_bounds("Europe/London", wednesday)
+
+    tz = pytz.timezone("Europe/London")
+    assert start == tz.localize(dt.datetime(2025, 3, 5, 0, 0))
+    assert end == tz.localize(dt.datetime(2025, 3, 9, 23, 59, 59, 999999))
+    assert tasks._week_bounds("Europe/London", wednesday) is tasks._week_bounds("Europe/London", wednesday)
@@ -0,0 +1,174 @@
+"""Tests for `tools.google_calendar` helpers."""
+
+from __future__ import annotations
+
+import datetime as dt
+import json
+import threading
+from unittest.mock import MagicMock
+from zoneinfo import ZoneInfo
+
+import pytest
+import pytz
+
+from tools import google_calendar
+
+
+def test_get_timezone_name_uses_pytz_zone() -> None:
+    tz = pytz.timezone("America/New_York")
+    start = tz.localize(dt.datetime(2025, 3, 5, 9, 0))
+
+    assert google_calendar._get_timezone_name(start) == "America/New_York"
+    # Second lookup is served from the memoized zone name
+    assert google_calendar._get_timezone_name(start) == "America/New_York"
+
+
+def test_get_timezone_name_naive_and_fixed_offset() -> None:
+    naive = dt.datetime(2025, 3, 5, 9, 0)
+    fixed = dt.datetime(2025, 3, 5, 9, 0, tzinfo=dt.timezone.utc)
+
+    assert google_calendar._get_timezone_name(naive) == "UTC"
+    assert google_calendar._get_timezone_name(fixed) == "UTC"
+
+
+def test_get_timezone_name_uses_zoneinfo_key() -> None:
+    start = dt.datetime(2025, 7, 5, 9, 0, tzinfo=ZoneInfo("Europe/London"))
+
+    # IANA key, not the DST abbreviation ("BST") that tzname() would return
+    assert google_calendar._get_timezone_name(start) == "Europe/London"
+
+
+def test_get_calendar_service_is_built_once_per_thread(monkeypatch: pytest.MonkeyPatch) -> None:
+    builds: list[object] = []
+
+    def fake_build_service(creds: object) -> object:
+        service = object()
+        builds.append(service)
+        return service
+
+    monkeypatch.setattr(google_calendar, "_thread_local", threading.local())
+    monkeypatch.setattr(google_calendar, "_get_credentials", lambda: "creds")
+    monkeypatch.setattr(google_calendar, "_build_service", fake_build_service)
+
+    first = google_calendar.get_calendar_service()
+    second = google_calendar.get_calendar_service()
+
+    other_thread: list[object] = []
+    worker = threading.Thread(target=lambda: other_thread.append(google_calendar.get_calendar_service()))
+    worker.start()
+    worker.join()
+
+    assert first is second
+    assert other_thread[0] is not first
+    assert len(builds) == 2
+
+
+def test_delete_calendar_event_treats_404_as_deleted(monkeypatch: pytest.MonkeyPatch) -> None:
+    from googleapiclient.errors import HttpError
+
+    class Response(dict):
+        status = 404
+        reason = "Not Found"
+
+    service = MagicMock()
+    service.events.return_value.delete.return_value.execute.side_effect = HttpError(Response(), b"")
+    monkeypatch.setattr(google_calendar, "get_calendar_service", lambda: service)
+
+    assert google_calendar.delete_calendar_event("missing-event") is True
+
+
+def test_build_service_uses_bundled_discovery_document() -> None:
+    service = google_calendar._build_service(MagicMock())
+
+    assert json.loads(google_calendar._discovery_document())["name"] == "calendar"
+    assert hasattr(service, "events")
+
+
+def test_build_service_fetches_discovery_document_when_not_bundled(monkeypatch: pytest.MonkeyPatch) -> None:
+    from googleapiclient import discovery
+
+    calls: list[dict[str, object]] = []
+
+    def fake_build(service_name: str, version: str, **kwargs: object) -> str:
+        calls.append({"name": service_name, "version": version, **kwargs})
+        return "service"
+
+    monkeypatch.setattr(google_calendar, "_discovery_document", lambda: None)
+    monkeypatch.setattr(discovery, "build", fake_build)
+
+    assert google_calendar._build_service(MagicMock()) == "service"
+    assert calls[0]["static_discovery"] is False
+
+
+def test_update_calendar_event_patches_only_provided_fields(monkeypatch: pytest.MonkeyPatch) -> None:
+    service = MagicMock()
+    monkeypatch.setattr(google_calendar, "get_calendar_service", lambda: service)
+    monkeypatch.delenv("GOOGLE_CALENDAR_ID", raising=False)
+
+    assert google_calendar.update_calendar_event("event-1", summary="New title") is True
+
+    service.events.return_value.get.assert_not_called()
+    service.events.return_value.patch.assert_called_once_with(
+        calendarId="primary", eventId="event-1", body={"summary": "New title"}
+    )
+
+
+def test_list_calendar_events_caches_until_a_write(monkeypatch: pytest.MonkeyPatch) -> None:
+    service = MagicMock()
+    service.events.return_value.list.return_value.execute.return_value = {
+        "items": [{"id": "e1", "summary": "Standup", "start": {"dateTime": "2025-03-05T10:00:00Z"}}]
+    }
+    service.events.return_value.insert.return_value.execute.return_value = {"id": "e2"}
+    monkeypatch.setattr(google_calendar, "get_calendar_service", lambda: service)
+    monkeypatch.setattr(google_calendar, "_events_cache", {})
+
+    start = dt.datetime(2025, 3, 5, tzinfo=dt.timezone.utc)
+    end = start + dt.timedelta(days=7)
+
+    first = google_calendar.list_calendar_events(start, end)
+    second = google_calendar.list_calendar_events(start, end)
+
+    assert first == second
+    assert service.events.return_value.list.call_count == 1
+
+    # Creating an event invalidates cached listings
+    google_calendar.create_calendar_event("Review", start)
+    google_calendar.list_calendar_events(start, end)
+
+    assert service.events.return_value.list.call_count == 2
+
+
+def test_format_event_handles_all_day_and_missing_fields() -> None:
+    formatted = google_calendar._format_event(
+        {"id": "e1", "start": {"date": "2025-03-05"}, "end": {"date": "2025-03-06"}}
+    )
+
+    assert formatted == {
+        "id": "e1",
+        "summary": "(No title)",
+        "start": "2025-03-05",
+        "end": "2025-03-06",
+        "description": "",
+        "location": "",
+        "all_day": True,
+    }
+
+
+def test_rfc3339_marks_naive_datetimes_as_utc() -> None:
+    naive = dt.datetime(2025, 3, 5, 9, 0)
+    aware = dt.datetime(2025, 3, 5, 9, 0, tzinfo=dt.timezone.utc)
+
+    assert google_calendar._rfc3339(naive) == "2025-03-05T09:00:00Z"
+    assert google_calendar._rfc3339(aware) == "2025-03-05T09:00:00+00:00"
+
+
+def test_build_event_body_sets_end_and_reminders() -> None:
+    start = pytz.timezone("Europe/London").localize(dt.datetime(2025, 3, 5, 9, 0))
+
+    body = google_calendar._build_event_body("Call Gabi", start, duration_minutes=45, location="Office")
+
+    assert body["description"] == "Reminder: Call Gabi"
+    assert body["start"] == {"dateTime": "2025-03-05T09:00:00+00:00", "timeZone": "Europe/London"}
+    assert body["end"]["dateTime"] == "2025-03-05T09:45:00+00:00"
+    assert body["location"] == "Office"
+    assert body["reminders"]["useDefault"] is False
@@ -7,6 +7,7 @@ from typing import Any, List, Optional
 
 import pytest
 import pytz
+from freezegun import freeze_time
 
 from tools import tasks
 
@@ -15,6 +16,24 @@ def _stub_datetime() -> dt.datetime:
     return pytz.UTC.localize(dt.datetime(2025, 3, 5, 9, 0))
 
 
+def _row(
+    task_id: int,
+    description: str,
+    due_date: Optional[str] = None,
+    calendar_event_id: Optional[str] = None,
+) -> dict[str, Any]:
+    """Stand-in for a `sqlite3.Row`, which tools read by column name."""
+    return {
+        "id": task_id,
+        "description": description,
+        "done": False,
+        "created_at": "created",
+        "due_date": due_date,
+        "calendar_event_id": calendar_event_id,
+        "timezone": "UTC",
+    }
+
+
 def test_create_reminder_with_calendar_success(monkeypatch: pytest.MonkeyPatch) -> None:
     created_payload: dict[str, Any] = {}
     updated: Optional[tuple[int, str, str]] = None
@@ -36,8 +55,8 @@ def test_create_reminder_with_calendar_success(monkeypatch: pytest.MonkeyPatch)
             updated = (task_id, user_id, calendar_event_id)
 
     repo = Repo()
-    monkeypatch.setattr(tasks, "TaskRepository", lambda: repo)
-    monkeypatch.setattr("utils.date_parser.parse_natural_language_date", lambda when, timezone: _stub_datetime())
+    monkeypatch.setattr(tasks, "_repo", lambda: repo)
+    monkeypatch.setattr(tasks, "parse_natural_language_date", lambda when, timezone: _stub_datetime())
     monkeypatch.setattr(tasks, "is_date_in_past", lambda dt_obj: False)
     monkeypatch.setattr(
         tasks,
@@ -64,8 +83,8 @@ def test_create_reminder_handles_calendar_failure(monkeypatch: pytest.MonkeyPatc
             self.updated.append((task_id, user_id, calendar_event_id))
 
     repo = Repo()
-    monkeypatch.setattr(tasks, "TaskRepository", lambda: repo)
-    monkeypatch.setattr("utils.date_parser.parse_natural_language_date", lambda *args, **kwargs: _stub_datetime())
+    monkeypatch.setattr(tasks, "_repo", lambda: repo)
+    monkeypatch.setattr(tasks, "parse_natural_language_date", lambda *args, **kwargs: _stub_datetime())
     monkeypatch.setattr(tasks, "is_date_in_past", lambda dt_obj: False)
     monkeypatch.setattr(tasks, "create_calendar_event", lambda **kwargs: None)
 
@@ -84,15 +103,15 @@ def test_create_reminder_rejects_past_or_unparsed_times(monkeypatch: pytest.Monk
             self.created += 1
 
     repo = Repo()
-    monkeypatch.setattr(tasks, "TaskRepository", lambda: repo)
-    monkeypatch.setattr("utils.date_parser.parse_natural_language_date", lambda *args, **kwargs: None)
+    monkeypatch.setattr(tasks, "_repo", lambda: repo)
+    monkeypatch.setattr(tasks, "parse_natural_language_date", lambda *args, **kwargs: None)
 
     message = tasks.create_reminder("call mom", "someday", "user-1")
 
     assert "Couldn't understand" in message
     assert repo.created == 0
 
-    monkeypatch.setattr("utils.date_parser.parse_natural_language_date", lambda *args, **kwargs: _stub_datetime())
+    monkeypatch.setattr(tasks, "parse_natural_language_date", lambda *args, **kwargs: _stub_datetime())
     monkeypatch.setattr(tasks, "is_date_in_past", lambda dt_obj: True)
 
     message_past = tasks.create_reminder("call mom", "yesterday", "user-1")
@@ -107,8 +126,8 @@ def test_create_reminder_handles_missing_calendar_credentials(monkeypatch: pytes
             return 5
 
     repo = Repo()
-    monkeypatch.setattr(tasks, "TaskRepository", lambda: repo)
-    monkeypatch.setattr("utils.date_parser.parse_natural_language_date", lambda *args, **kwargs: _stub_datetime())
+    monkeypatch.setattr(tasks, "_repo", lambda: repo)
+    monkeypatch.setattr(tasks, "parse_natural_language_date", lambda *args, **kwargs: _stub_datetime())
     monkeypatch.setattr(tasks, "is_date_in_past", lambda dt_obj: False)
 
     def raise_file_not_found(*args, **kwargs):
@@ -126,8 +145,8 @@ def test_create_reminder_handles_general_errors(monkeypatch: pytest.MonkeyPatch)
         def create_task(self, *args, **kwargs):
             raise RuntimeError("boom")
 
-    monkeypatch.setattr(tasks, "TaskRepository", lambda: Repo())
-    monkeypatch.setattr("utils.date_parser.parse_natural_language_date", lambda *args, **kwargs: _stub_datetime())
+    monkeypatch.setattr(tasks, "_repo", lambda: Repo())
+    monkeypatch.setattr(tasks, "parse_natural_language_date", lambda *args, **kwargs: _stub_datetime())
     monkeypatch.setattr(tasks, "is_date_in_past", lambda dt_obj: False)
 
     message = tasks.create_reminder("call mom", "tomorrow", "user-1")
@@ -142,7 +161,7 @@ def test_add_task_happy_path(monkeypatch: pytest.MonkeyPatch) -> None:
             assert description == "buy milk"
             return 3
 
-    monkeypatch.setattr(tasks, "TaskRepository", lambda: Repo())
+    monkeypatch.setattr(tasks, "_repo", lambda: Repo())
 
     message = tasks.add_task("buy milk", "user-1")
 
@@ -154,29 +173,32 @@ def test_add_task_handles_errors(monkeypatch: pytest.MonkeyPatch) -> None:
         def create_task(self, *args, **kwargs):
             raise ValueError("duplicate")
 
-    monkeypatch.setattr(tasks, "TaskRepository", lambda: Repo())
+    monkeypatch.setattr(tasks, "_repo", lambda: Repo())
 
     message = tasks.add_task("buy milk", "user-1")
 
     assert message == "❌ Error adding task: duplicate"
 
 
+@freeze_time("2025-03-05 08:00:00", tz_offset=0)
 def test_list_tasks_with_due_dates(monkeypatch: pytest.MonkeyPatch) -> None:
     class Repo:
         def get_user_tasks(self, user_id: str, done: bool = False):
             assert user_id == "user-1"
             assert done is False
             return [
-                (1, "Task A", False, "created", "2025-03-05T09:00:00+00:00", None, "UTC"),
+                _row(1, "Task A", "2025-03-05T09:00:00+00:00"),
             ]
 
-    monkeypatch.setattr(tasks, "TaskRepository", lambda: Repo())
-    monkeypatch.setattr(tasks, "iso_to_datetime", lambda iso: _stub_datetime())
-    monkeypatch.setattr(tasks, "format_datetime_relative", lambda dt_obj, tz: "Due soon")
+    monkeypatch.setattr(tasks, "_repo", lambda: Repo())
 
-    message = tasks.list_tasks("user-1")
+    tasks._format_due.cache_clear()
+    try:
+        message = tasks.list_tasks("user-1")
+    finally:
+        tasks._format_due.cache_clear()
 
-    assert "1. Task A (Due: Due soon)" in message
+    assert "1. Task A (Due: Today at 9:00 AM)" in message
 
 
 def test_list_tasks_when_empty(monkeypatch: pytest.MonkeyPatch) -> None:
@@ -184,7 +206,7 @@ def test_list_tasks_when_empty(monkeypatch: pytest.MonkeyPatch) -> None:
         def get_user_tasks(self, user_id: str, done: bool = False):
             return []
 
-    monkeypatch.setattr(tasks, "TaskRepository", lambda: Repo())
+    monkeypatch.setattr(tasks, "_repo", lambda: Repo())
 
     assert tasks.list_tasks("user-1") == "You have no tasks! 🎉"
 
@@ -193,19 +215,15 @@ def test_list_tasks_fallback_to_raw_due_date(monkeypatch: pytest.MonkeyPatch) ->
     class Repo:
         def get_user_tasks(self, user_id: str, done: bool = False):
             return [
-                (1, "Task A", False, "created", "RAWDATE", None, "UTC"),
+                _row(1, "Task A", "RAWDATE"),
             ]
 
-    monkeypatch.setattr(tasks, "TaskRepository", lambda: Repo())
-
-    def raise_parse_error(_iso: str):
-        raise ValueError("bad format")
-
-    monkeypatch.setattr(tasks, "iso_to_datetime", raise_parse_error)
+    monkeypatch.setattr(tasks, "_repo", lambda: Repo())
 
     message = tasks.list_tasks("user-1")
 
-    assert "RAWDATE" in message
+    # Not valid ISO 8601, so fromisoformat fails and the stored value is shown
+    assert "1. Task A (Due: RAWDATE)" in message
 
 
 def test_mark_task_done_success_cases(monkeypatch: pytest.MonkeyPatch) -> None:
@@ -214,29 +232,26 @@ def test_mark_task_done_success_cases(monkeypatch: pytest.MonkeyPatch) -> None:
             self.calendar_event_id = calendar_event_id
             self.mark_calls: list[tuple[int, str]] = []
 
-        def get_user_tasks(self, user_id: str, done: bool = False):
-            return [
-                (1, "Task", False, "created", None, self.calendar_event_id, "UTC"),
-            ]
-
-        def mark_task_done(self, task_id: int, user_id: str) -> bool:
-            self.mark_calls.append((task_id, user_id))
-            return True
+        def mark_task_done_by_number(self, user_id: str, task_number: int):
+            self.mark_calls.append((task_number, user_id))
+            return _row(1, "Task", calendar_event_id=self.calendar_event_id)
 
     # Scenario: calendar deletion succeeds
     repo_with_calendar = Repo("cal-1")
-    monkeypatch.setattr(tasks, "TaskRepository", lambda: repo_with_calendar)
-    monkeypatch.setattr(tasks, "delete_calendar_event", lambda event_id: True)
+    deleted: list[str] = []
+    monkeypatch.setattr(tasks, "_repo", lambda: repo_with_calendar)
+    monkeypatch.setattr(tasks, "delete_calendar_event", lambda event_id: deleted.append(event_id) or True)
 
     message = tasks.mark_task_done(1, "user-1")
 
     assert "Marked task #1" in message
-    assert "Removed from Google Calendar" in message
+    assert "Removing from Google Calendar" in message
+    assert deleted == ["cal-1"]
     assert repo_with_calendar.mark_calls == [(1, "user-1")]
 
     # Scenario: calendar deletion fails but should still succeed
     repo_without_calendar = Repo("cal-2")
-    monkeypatch.setattr(tasks, "TaskRepository", lambda: repo_without_calendar)
+    monkeypatch.setattr(tasks, "_repo", lambda: repo_without_calendar)
 
     def raise_delete_error(event_id: str) -> None:
         raise RuntimeError("delete failed")
@@ -245,65 +260,265 @@ def test_mark_task_done_success_cases(monkeypatch: pytest.MonkeyPatch) -> None:
 
     message_no_calendar = tasks.mark_task_done(1, "user-2")
 
-    assert "Removed from Google Calendar" not in message_no_calendar
+    assert "Marked task #1" in message_no_calendar
     assert repo_without_calendar.mark_calls == [(1, "user-2")]
 
 
 def test_mark_task_done_validates_input(monkeypatch: pytest.MonkeyPatch) -> None:
     class Repo:
-        def __init__(self, tasks_list: List[tuple]) -> None:
+        def __init__(self, tasks_list: List[dict[str, Any]]) -> None:
             self.tasks = tasks_list
 
-        def get_user_tasks(self, user_id: str, done: bool = False):
-            return self.tasks
+        def count_user_tasks(self, user_id: str, done: bool = False) -> int:
+            return len(self.tasks)
 
-        def mark_task_done(self, *args, **kwargs) -> bool:
-            return False
+        def mark_task_done_by_number(self, user_id: str, task_number: int):
+            if 1 <= task_number <= len(self.tasks):
+                return self.tasks[task_number - 1]
+            return None
 
     # No tasks available
     repo_empty = Repo([])
-    monkeypatch.setattr(tasks, "TaskRepository", lambda: repo_empty)
+    monkeypatch.setattr(tasks, "_repo", lambda: repo_empty)
     assert tasks.mark_task_done(1, "user-1") == "❌ You have no tasks to mark as done."
 
     # Invalid index
-    repo_with_tasks = Repo([(1, "Task", False, "created", None, None, "UTC")])
-    monkeypatch.setattr(tasks, "TaskRepository", lambda: repo_with_tasks)
+    repo_with_tasks = Repo([_row(1, "Task")])
+    monkeypatch.setattr(tasks, "_repo", lambda: repo_with_tasks)
     assert "Invalid task number" in tasks.mark_task_done(2, "user-1")
-
-    # Failed to mark task as done (returns False)
-    assert tasks.mark_task_done(1, "user-1") == "❌ Failed to mark task as done."
+    assert "Invalid task number" in tasks.mark_task_done(0, "user-1")
 
 
 def test_clear_all_tasks_confirmation_flow(monkeypatch: pytest.MonkeyPatch) -> None:
     class Repo:
         def __init__(self) -> None:
-            self.tasks: List[tuple] = []
+            self.tasks: List[dict[str, Any]] = []
             self.cleared: int = 0
 
-        def get_user_tasks(self, user_id: str, done: bool = False):
-            return self.tasks
+        def count_user_tasks(self, user_id: str, done: bool = False) -> int:
+            return len(self.tasks)
+
+        def get_scheduled_tasks(self, user_id: str, done: bool = False):
+            return [task for task in self.tasks if task["due_date"]]
 
         def clear_all_tasks(self, user_id: str) -> int:
             return self.cleared
 
     repo = Repo()
-    monkeypatch.setattr(tasks, "TaskRepository", lambda: repo)
+    monkeypatch.setattr(tasks, "_repo", lambda: repo)
 
     # No tasks
     repo.tasks = []
     assert tasks.clear_all_tasks("user-1") == "You have no tasks to clear."
 
     # One task, not confirmed
-    repo.tasks = [(1, "Task", False, "created", None, None, "UTC")]
+    repo.tasks = [_row(1, "Task")]
     assert "delete your 1 task" in tasks.clear_all_tasks("user-1", confirmed=False)
 
     # Multiple tasks prompt
     repo.tasks = [
-        (1, "Task", False, "created", None, None, "UTC"),
-        (2, "Task", False, "created", None, None, "UTC"),
+        _row(1, "Task"),
+        _row(2, "Task"),
     ]
     assert "delete all 2 tasks" in tasks.clear_all_tasks("user-1", confirmed=False)
 
-    # Confirmed deletion
+    # Confirmed deletion also removes calendar events of the cleared tasks
+    deleted: List[str] = []
+    monkeypatch.setattr(tasks, "delete_calendar_event", lambda event_id: deleted.append(event_id) or True)
+    repo.tasks[1] = _row(2, "Task", "2025-03-05T09:00:00+00:00", "cal-2")
     repo.cleared = 2
     assert tasks.clear_all_tasks("user-1", confirmed=True) == "✓ Cleared 2 tasks!"
+    assert deleted == ["cal-2"]
+
+    repo.tasks = [_row(1, "Task")]
+    repo.cleared = 1
+    assert tasks.clear_all_tasks("user-1", confirmed=True) == "✓ Cleared 1 task!"
+
+
+def test_tools_share_a_single_repository(monkeypatch: pytest.MonkeyPatch) -> None:
+    created: List[Any] = []
+
+    class Repo:
+        def __init__(self) -> None:
+            created.append(self)
+
+        def create_task(self, user_id: str, description: str) -> int:
+            return len(created)
+
+    monkeypatch.setattr(tasks, "TaskRepository", Repo)
+    tasks._repo.cache_clear()
+    try:
+        tasks.add_task("first", "user-1")
+        tasks.add_task("second", "user-1")
+    finally:
+        tasks._repo.cache_clear()
+
+    assert len(created) == 1
+
+
+def test_create_reminder_iso_input_skips_natural_language_parsing(monkeypatch: pytest.MonkeyPatch) -> None:
+    created: dict[str, Any] = {}
+
+    class Repo:
+        def create_task(self, user_id: str, description: str, due_date: str, timezone: str) -> int:
+            created.update({"due_date": due_date, "timezone": timezone})
+            return 3
+
+    def fail_parse(*args: Any, **kwargs: Any) -> None:
+        raise AssertionError("natural-language parser should not be called for ISO input")
+
+    repo = Repo()
+    monkeypatch.setattr(tasks, "_repo", lambda: repo)
+    monkeypatch.setattr(tasks, "parse_natural_language_date", fail_parse)
+    monkeypatch.setattr(tasks, "is_date_in_past", lambda dt_obj: False)
+    monkeypatch.setattr(tasks, "create_calendar_event", lambda **kwargs: None)
+
+    message = tasks.create_reminder("call mom", "2030-03-05T09:00", "user-1", timezone="Europe/London")
+
+    assert "call mom" in message
+    # Naive ISO input is interpreted in the user's timezone
+    assert created == {"due_date": "2030-03-05T09:00:00+00:00", "timezone": "Europe/London"}
+
+
+def test_parse_when_converts_iso_offsets_to_user_timezone(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(tasks, "parse_natural_language_date", lambda *args, **kwargs: None)
+
+    from_utc = tasks._parse_when("2026-10-20T10:00:00Z", "Europe/London")
+    from_offset = tasks._parse_when("2026-10-20T10:00:00-04:00", "Europe/London")
+
+    assert (from_utc.hour, from_utc.utcoffset()) == (11, dt.timedelta(hours=1))
+    assert (from_offset.hour, from_offset.utcoffset()) == (15, dt.timedelta(hours=1))
+    # The zone itself is kept, so the calendar event gets an IANA name
+    assert str(from_offset.tzinfo) == "Europe/London"
+
+
+def test_create_reminder_keeps_task_when_calendar_is_slow(monkeypatch: pytest.MonkeyPatch) -> None:
+    from concurrent.futures import Future
+
+    class Repo:
+        def __init__(self) -> None:
+            self.created = 0
+            self.updated: List[Any] = []
+
+        def create_task(self, *args: Any, **kwargs: Any) -> int:
+            self.created += 1
+            return 4
+
+        def update_calendar_event_id(self, task_id: int, user_id: str, calendar_event_id: str) -> None:
+            self.updated.append((task_id, user_id, calendar_event_id))
+
+    pending: Future = Future()
+
+    class PendingExecutor:
+        def submit(self, fn: Any, *args: Any, **kwargs: Any) -> Future:
+            return pending  # completes only when the test resolves it
+
+    repo = Repo()
+    monkeypatch.setattr(tasks, "_repo", lambda: repo)
+    monkeypatch.setattr(tasks, "_CAL_EXECUTOR", PendingExecutor())
+    monkeypatch.setattr(tasks, "_CALENDAR_CREATE_TIMEOUT_SECONDS", 0)
+    monkeypatch.setattr(tasks, "parse_natural_language_date", lambda *args, **kwargs: _stub_datetime())
+    monkeypatch.setattr(tasks, "is_date_in_past", lambda dt_obj: False)
+
+    message = tasks.create_reminder("call mom", "tomorrow", "user-1")
+
+    assert repo.created == 1
+    assert "Couldn't add to Google Calendar" in message
+    assert repo.updated == []
+
+    # The event arrives after the tool replied; it is still linked to the task
+    pending.set_result("late-event")
+
+    assert repo.updated == [(4, "user-1", "late-event")]
+
+
+def test_create_reminder_removes_calendar_event_when_task_insert_fails(monkeypatch: pytest.MonkeyPatch) -> None:
+    deleted: List[str] = []
+
+    class Repo:
+        def create_task(self, *args: Any, **kwargs: Any) -> int:
+            raise RuntimeError("disk full")
+
+    monkeypatch.setattr(tasks, "_repo", lambda: Repo())
+    monkeypatch.setattr(tasks, "parse_natural_language_date", lambda *args, **kwargs: _stub_datetime())
+    monkeypatch.setattr(tasks, "is_date_in_past", lambda dt_obj: False)
+    monkeypatch.setattr(tasks, "create_calendar_event", lambda **kwargs: "orphan-event")
+    monkeypatch.setattr(tasks, "delete_calendar_event", lambda event_id: deleted.append(event_id) or True)
+
+    message = tasks.create_reminder("call mom", "tomorrow", "user-1")
+
+    assert message == "❌ Error creating reminder: disk full"
+    assert deleted == ["orphan-event"]
+
+
+def test_create_reminder_cancels_pending_calendar_create_when_task_insert_fails(monkeypatch: pytest.MonkeyPatch) -> None:
+    from concurrent.futures import Future
+
+    pending: Future = Future()
+
+    class Repo:
+        def create_task(self, *args: Any, **kwargs: Any) -> int:
+            raise RuntimeError("disk full")
+
+    class PendingExecutor:
+        def submit(self, fn: Any, *args: Any, **kwargs: Any) -> Future:
+            return pending  # queued, not yet started
+
+    monkeypatch.setattr(tasks, "_repo", lambda: Repo())
+    monkeypatch.setattr(tasks, "_CAL_EXECUTOR", PendingExecutor())
+    monkeypatch.setattr(tasks, "parse_natural_language_date", lambda *args, **kwargs: _stub_datetime())
+    monkeypatch.setattr(tasks, "is_date_in_past", lambda dt_obj: False)
+
+    message = tasks.create_reminder("call mom", "tomorrow", "user-1")
+
+    assert message == "❌ Error creating reminder: disk full"
+    assert pending.cancelled()
+
+
+def test_list_tasks_reuses_formatted_due_dates(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: List[str] = []
+
+    class Repo:
+        def get_user_tasks(self, user_id: str, done: bool = False):
+            return [_row(1, "Task A", "2030-03-05T09:00:00+00:00")]
+
+    def counting_formatter(dt_obj: dt.datetime, tz: str) -> str:
+        calls.append(tz)
+        return "Later"
+
+    monkeypatch.setattr(tasks, "_repo", lambda: Repo())
+    monkeypatch.setattr(tasks, "format_datetime_relative", counting_formatter)
+
+    tasks._format_due.cache_clear()
+    tasks._parse_due.cache_clear()
+    try:
+        first = tasks.list_tasks("user-1")
+        second = tasks.list_tasks("user-1")
+        parse_misses = tasks._parse_due.cache_info().misses
+    finally:
+        tasks._format_due.cache_clear()
+
+    assert first == second == "Your tasks:\n1. Task A (Due: Later)"
+    assert calls == ["UTC"]
+    # The stored due date is parsed once, not on every listing
+    assert parse_misses == 1
+
+
+def test_invalid_input_is_rejected_before_touching_the_repository(monkeypatch: pytest.MonkeyPatch) -> None:
+    def no_repo() -> None:
+        raise AssertionError("repository should not be used for invalid input")
+
+    monkeypatch.setattr(tasks, "_repo", no_repo)
+
+    assert "Invalid task number" in tasks.mark_task_done(0, "user-1")
+    assert "Invalid task number" in tasks.mark_task_done(-3, "user-1")
+    assert tasks.create_reminder("  ", "tomorrow", "user-1").startswith("❌")
+    assert tasks.create_reminder("call mom", "", "user-1").startswith("❌")
+
+
+def test_malformed_tool_args_return_error_messages(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(tasks, "_repo", lambda: None)
+
+    # The agent passes the LLM's raw arguments through without coercion
+    assert tasks.mark_task_done("2", "user-1").startswith("❌ Error marking task as done:")
+    assert tasks.create_reminder("call mom", None, "user-1").startswith("❌ Error creating reminder:")
@@ -54,6 +54,13 @@ def test_format_datetime_for_display_human_readable() -> None:
     assert date_parser.format_datetime_for_display(sample) == "Saturday, March 01, 2025 at 02:30 PM"
 
 
+def test_format_datetime_for_display_matches_strftime_at_noon_and_midnight() -> None:
+    for hour in (0, 11, 12, 23):
+        sample = dt.datetime(2025, 12, 7, hour, 5)
+
+        assert date_parser.format_datetime_for_display(sample) == sample.strftime("%A, %B %d, %Y at %I:%M %p")
+
+
 @freeze_time("2025-03-10 09:00:00", tz_offset=0)
 def test_format_datetime_relative_variants() -> None:
     tz = "UTC"
@@ -74,3 +81,173 @@ def test_iso_conversion_round_trip() -> None:
     restored = date_parser.iso_to_datetime(serialized)
 
     assert restored == original
+
+
+def test_get_timezone_is_cached() -> None:
+    tz = date_parser.get_timezone("America/New_York")
+
+    assert tz is date_parser.get_timezone("America/New_York")
+    assert tz.key == "America/New_York"
+
+
+@freeze_time("2025-03-01 08:00:00", tz_offset=0)
+def test_extract_date_from_task_prefers_most_specific_pattern() -> None:
+    parsed, cleaned = date_parser.extract_date_from_task("pay rent today, dentist tomorrow at 10am", timezone="UTC")
+
+    assert parsed == pytz.UTC.localize(dt.datetime(2025, 3, 2, 10, 0))
+    assert cleaned == "Pay rent today, dentist"
+
+
+def test_parse_natural_language_date_is_memoized_within_a_minute() -> None:
+    date_parser._parse_cached.cache_clear()
+
+    with freeze_time("2025-03-01 12:00:10", tz_offset=0):
+        first = date_parser.parse_natural_language_date("In 3 hours", timezone="UTC")
+        second = date_parser.parse_natural_language_date("  in 3 hours ", timezone="UTC")
+
+    assert first is second
+    assert date_parser._parse_cached.cache_info().hits == 1
+
+    # A new minute is a new key, so relative phrases are re-evaluated
+    with freeze_time("2025-03-01 12:01:10", tz_offset=0):
+        date_parser.parse_natural_language_date("in 3 hours", timezone="UTC")
+
+    assert date_parser._parse_cached.cache_info().misses == 2
+
+
+def test_parse_natural_language_date_day_phrases_are_memoized_for_the_day() -> None:
+    date_parser._parse_cached.cache_clear()
+
+    with freeze_time("2025-03-01 08:00:00", tz_offset=0):
+        first = date_parser.parse_natural_language_date("tomorrow at 10am", timezone="America/New_York")
+    with freeze_time("2025-03-02 04:59:00", tz_offset=0):
+        second = date_parser.parse_natural_language_date("tomorrow at 10am", timezone="America/New_York")
+
+    assert first is second
+    assert date_parser._parse_cached.cache_info().misses == 1
+
+    # Midnight in New York starts a new key
+    with freeze_time("2025-03-02 05:00:00", tz_offset=0):
+        third = date_parser.parse_natural_language_date("tomorrow at 10am", timezone="America/New_York")
+
+    assert third == pytz.timezone("America/New_York").localize(dt.datetime(2025, 3, 3, 10, 0))
+    assert date_parser._parse_cached.cache_info().misses == 2
+
+
+@freeze_time("2025-03-01 15:30:45", tz_offset=0)
+def test_parse_fast_path_matches_dateparser() -> None:
+    import dateparser
+
+    for timezone in ("UTC", "America/New_York"):
+        settings = {
+            "PREFER_DATES_FROM": "future",
+            "TIMEZONE": timezone,
+            "RETURN_AS_TIMEZONE_AWARE": True,
+            "TO_TIMEZONE": timezone,
+        }
+        for phrase in ("today", "tomorrow", "tomorrow at 10am", "today at 2:30 pm", "tomorrow at 12am", "in 3 hours", "in 2 weeks"):
+            assert date_parser._parse_fast_path(phrase, timezone) == dateparser.parse(phrase, settings=settings), phrase
+
+
+@freeze_time("2025-03-01 15:30:45", tz_offset=0)
+def test_parse_natural_language_date_common_phrases_skip_dateparser(monkeypatch) -> None:
+    def fail(*args, **kwargs):
+        raise AssertionError("dateparser should not be called")
+
+    monkeypatch.setattr(date_parser, "_date_data_parser", fail)
+    date_parser._parse_cached.cache_clear()
+
+    result = date_parser.parse_natural_language_date("Tomorrow at 9:15AM", timezone="America/New_York")
+
+    assert result == pytz.timezone("America/New_York").localize(dt.datetime(2025, 3, 2, 9, 15))
+    # Out-of-range times are left to dateparser
+    assert date_parser._parse_fast_path("tomorrow at 13pm", "UTC") is None
+
+
+@freeze_time("2025-03-01 15:30:45", tz_offset=0)
+def test_parse_natural_language_date_reuses_dateparser_parser() -> None:
+    date_parser._parse_cached.cache_clear()
+    date_parser._date_data_parser.cache_clear()
+
+    first = date_parser.parse_natural_language_date("march 5 at 2pm", timezone="Europe/London")
+    second = date_parser.parse_natural_language_date("march 7 at 2pm", timezone="Europe/London")
+
+    assert first == pytz.timezone("Europe/London").localize(dt.datetime(2025, 3, 5, 14, 0))
+    assert second == pytz.timezone("Europe/London").localize(dt.datetime(2025, 3, 7, 14, 0))
+    assert date_parser._date_data_parser.cache_info().currsize == 1
+
+
+def test_iso_to_datetime_batch_matches_single_conversion() -> None:
+    values = ["2025-10-28T10:00:00Z", " 2025-10-28T10:00:00+01:00 ", "2025-10-28T10:00:00"]
+
+    assert date_parser.iso_to_datetime_batch(values) == [date_parser.iso_to_datetime(v) for v in values]
+    assert date_parser.iso_to_datetime_batch([]) == []
+
+
+def test_iso_to_datetime_normalizes_z_before_python_311(monkeypatch) -> None:
+    values = ["2025-10-28T10:00:00Z", " 2025-10-28T10:00:00+01:00 "]
+    native = [date_parser.iso_to_datetime(v) for v in values]
+
+    monkeypatch.setattr(date_parser, "_FROMISO_HANDLES_Z", False)
+
+    assert [date_parser.iso_to_datetime(v) for v in values] == native
+    assert date_parser.iso_to_datetime_batch(values) == native
+
+
+def test_extract_date_from_task_skips_parsing_without_temporal_hint(monkeypatch) -> None:
+    def fail(*args, **kwargs):
+        raise AssertionError("parser should not be called without a temporal hint")
+
+    monkeypatch.setattr(date_parser, "parse_natural_language_date", fail)
+
+    assert date_parser.extract_date_from_task("water the plants", timezone="UTC") == (None, "water the plants")
+
+
+def test_temporal_patterns_ignore_malformed_clock_runs() -> None:
+    text = "ticket 12345678:99pm " * 500
+
+    assert all(pattern.search(text) is None for pattern in date_parser._TEMPORAL_PATTERNS)
+    assert date_parser._FUSED_TEMPORAL.search(text) is None
+
+
+def test_has_temporal_hint_agrees_with_hint_regex() -> None:
+    samples = [
+        "water the plants", "Monitor servers", "pay rent", "call mom TOMORROW", "gym at 7",
+        "standup Mon", "Weekend trip", "lunch at noon", "taxes due in April", "read a book ٣",
+    ]
+
+    for text in samples:
+        assert date_parser._has_temporal_hint(text) == bool(date_parser._TEMPORAL_HINT.search(text)), text
+
+
+@freeze_time("2025-03-01 08:00:00", tz_offset=0)
+def test_extract_dates_batch_processes_each_description_once(monkeypatch) -> None:
+    calls = []
+    original = date_parser.extract_date_from_task
+
+    def counting_extract(description, timezone="UTC"):
+        calls.append(description)
+        return original(description, timezone)
+
+    monkeypatch.setattr(date_parser, "extract_date_from_task", counting_extract)
+
+    results = date_parser.extract_dates_batch(["call mom tomorrow at 9am", "read book", "call mom tomorrow at 9am"])
+
+    assert results[0] == results[2] == (pytz.UTC.localize(dt.datetime(2025, 3, 2, 9, 0)), "Call mom")
+    assert results[1] == (None, "read book")
+    assert calls == ["call mom tomorrow at 9am", "read book"]
+
+
+def test_is_date_in_past_batch_matches_single_check() -> None:
+    now = dt.datetime.now(dt.timezone.utc)
+    tokyo = pytz.timezone("Asia/Tokyo")
+    values = [
+        now - dt.timedelta(hours=1),
+        (now + dt.timedelta(hours=1)).astimezone(tokyo),
+        (now - dt.timedelta(hours=1)).astimezone(tokyo),
+        dt.datetime.now() + dt.timedelta(days=1),
+        dt.datetime.now() - dt.timedelta(days=1),
+    ]
+
+    assert date_parser.is_date_in_past_batch(values) == [True, False, True, False, True]
+    assert date_parser.is_date_in_past_batch([]) == []
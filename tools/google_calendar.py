@@ -21,21 +21,27 @@ Security:
 import os
 import pickle
 import json
+import logging
+import threading
+import time
+from functools import lru_cache
 
 # CRITICAL: Clean up stale GOOGLE_APPLICATION_CREDENTIALS before using Google clients
 # This env var may be inherited from shell/IDE and points to non-existent files
 # We use either OAuth (local) or Secret Manager (Cloud Run), NOT this env var
 if 'GOOGLE_APPLICATION_CREDENTIALS' in os.environ:
     del os.environ['GOOGLE_APPLICATION_CREDENTIALS']
-from datetime import datetime, timedelta
-from typing import Optional, Dict, Any, List
+from datetime import datetime, timedelta, tzinfo
+from typing import Optional, Dict, Any, List, Type, TYPE_CHECKING
+from zoneinfo import ZoneInfo
 
-from google.auth.transport.requests import Request
-from google.oauth2.credentials import Credentials
-from google.oauth2 import service_account
-from google_auth_oauthlib.flow import InstalledAppFlow
-from googleapiclient.discovery import build
-from googleapiclient.errors import HttpError
+# The Google client stack (googleapiclient, httplib2, oauthlib) is imported
+# lazily inside the functions that need it, so cold starts that never touch
+# the calendar don't pay for it.
+if TYPE_CHECKING:
+    from google.oauth2 import service_account
+
+logger = logging.getLogger(__name__)
 
 # Google Calendar API scopes
 # Using full calendar scope for read/write access to calendars and events
@@ -46,8 +52,70 @@ SCOPES = ['https://www.googleapis.com/auth/calendar']
 CREDENTIALS_PATH = 'credentials.json'
 TOKEN_PATH = 'token.json'
 
+# Built Calendar services, one per thread (httplib2.Http is not thread-safe)
+_thread_local = threading.local()
+
+# Short-lived cache of list_calendar_events results, so repeated schedule
+# questions within a conversation don't re-hit the API.
+# Maps (calendar_id, time_min, time_max, max_results) -> (expires_at, events).
+# Cleared whenever this module creates, updates or deletes an event.
+EVENTS_CACHE_TTL_SECONDS = 45
+EVENTS_CACHE_MAX_ENTRIES = 128
+_events_cache: Dict[tuple, tuple] = {}
+_events_cache_lock = threading.Lock()
+
+
+def _clear_events_cache() -> None:
+    """Drop all cached event listings (called after any calendar write)."""
+    with _events_cache_lock:
+        _events_cache.clear()
+
+
+@lru_cache(maxsize=64)
+def _tzname_for(tz_id: int, tz: tzinfo) -> Optional[str]:
+    """
+    Resolve the IANA zone name for a tzinfo object, memoized on its identity.
+
+    The tzinfo itself is part of the cache key, so it stays alive while cached
+    and its id() cannot be reused by another object.
+    """
+    # Try to get zone attribute (works for pytz timezone objects)
+    return getattr(tz, 'zone', None)
+
 
-def _load_service_account_credentials() -> service_account.Credentials:
+def _get_timezone_name(dt: datetime) -> str:
+    """Extract timezone name from datetime object (handles both pytz and zoneinfo)."""
+    tz = dt.tzinfo
+    if tz is None:
+        return 'UTC'
+    # zoneinfo already carries its IANA key - no lookup or DST math needed
+    if isinstance(tz, ZoneInfo):
+        return tz.key
+    zone = _tzname_for(id(tz), tz)
+    if zone:
+        return zone
+    # Fallback: use tzname() method (works for pytz StaticTzInfo).
+    # Not memoized - the abbreviation depends on dt (e.g. GMT vs BST).
+    tzname = tz.tzname(dt)
+    if tzname:
+        return tzname
+    # Last resort
+    return 'UTC'
+
+
+def _http_error() -> Type[Exception]:
+    """Return googleapiclient's HttpError class (imported lazily, only when matching an exception)."""
+    from googleapiclient.errors import HttpError
+    return HttpError
+
+
+def _rfc3339(dt: datetime) -> str:
+    """Format a datetime as RFC3339 for the API (naive datetimes are treated as UTC)."""
+    s = dt.isoformat()
+    return s + 'Z' if dt.tzinfo is None else s
+
+
+def _load_service_account_credentials() -> "service_account.Credentials":
     """
     Load service account credentials from environment variable.
 
@@ -74,6 +142,8 @@ def _load_service_account_credentials() -> service_account.Credentials:
             "Ensure Cloud Run deployment includes --set-secrets flag."
         )
 
+    from google.oauth2 import service_account
+
     # Parse JSON and create credentials
     service_account_info = json.loads(secret_json)
     credentials = service_account.Credentials.from_service_account_info(
@@ -88,6 +158,55 @@ def get_calendar_service() -> Any:
     """
     Get authenticated Google Calendar service.
 
+    The service is built once per thread and reused, so consecutive API calls
+    share one authorized HTTP client (keep-alive connection, no repeated TLS
+    handshake or discovery build). Token refresh is handled by AuthorizedHttp.
+
+    Returns:
+        Authenticated Google Calendar service object
+
+    Raises:
+        FileNotFoundError: If credentials.json not found (local mode)
+        Exception: If authentication fails
+    """
+    service = getattr(_thread_local, 'service', None)
+    if service is None:
+        service = _build_service(_get_credentials())
+        _thread_local.service = service
+    return service
+
+
+@lru_cache(maxsize=1)
+def _discovery_document() -> Optional[str]:
+    """
+    Read the Calendar v3 discovery document bundled with google-api-python-client.
+
+    Read once per process; build() would otherwise locate and re-read it on
+    every service build.
+    """
+    from googleapiclient.discovery_cache import get_static_doc
+    return get_static_doc('calendar', 'v3')
+
+
+def _build_service(creds: Any) -> Any:
+    """Build a Calendar v3 service on top of an authorized HTTP client."""
+    from google_auth_httplib2 import AuthorizedHttp
+    from googleapiclient.discovery import build, build_from_document
+    from googleapiclient.http import build_http
+
+    http = AuthorizedHttp(creds, http=build_http())
+    document = _discovery_document()
+    if document is None:
+        # Document not bundled with this client version - fetch it from the
+        # discovery service instead
+        return build('calendar', 'v3', http=http, static_discovery=False)
+    return build_from_document(document, http=http)
+
+
+def _get_credentials() -> Any:
+    """
+    Get credentials for the Google Calendar API.
+
     Cloud Run (CLOUD_RUN=true):
     - Uses service account credentials from Secret Manager
     - No browser interaction needed
@@ -99,7 +218,7 @@ def get_calendar_service() -> Any:
     - Personal calendar access
 
     Returns:
-        Authenticated Google Calendar service object
+        Credentials object (service account or OAuth user credentials)
 
     Raises:
         FileNotFoundError: If credentials.json not found (local mode)
@@ -108,11 +227,12 @@ def get_calendar_service() -> Any:
     # Check if running in Cloud Run
     if os.getenv('CLOUD_RUN') == 'true':
         # Use service account authentication
-        creds = _load_service_account_credentials()
-        service = build('calendar', 'v3', credentials=creds)
-        return service
+        return _load_service_account_credentials()
 
     # Local development: Use OAuth 2.0 flow
+    from google.auth.transport.requests import Request
+    from google_auth_oauthlib.flow import InstalledAppFlow
+
     creds = None
 
     # Check if we have a saved token from previous auth
@@ -147,9 +267,65 @@ def get_calendar_service() -> Any:
         with open(TOKEN_PATH, 'wb') as token:
             pickle.dump(creds, token)
 
-    # Build and return the service
-    service = build('calendar', 'v3', credentials=creds)
-    return service
+    return creds
+
+
+def _event_times(start_datetime: datetime, duration_minutes: int) -> Dict[str, Dict[str, str]]:
+    """Build the 'start'/'end' fields of an event body."""
+    end_datetime = start_datetime + timedelta(minutes=duration_minutes)
+    return {
+        'start': {
+            'dateTime': _rfc3339(start_datetime),
+            'timeZone': _get_timezone_name(start_datetime),
+        },
+        'end': {
+            'dateTime': _rfc3339(end_datetime),
+            'timeZone': _get_timezone_name(end_datetime),
+        },
+    }
+
+
+def _build_event_body(
+    summary: str,
+    start_datetime: datetime,
+    duration_minutes: int = 30,
+    description: Optional[str] = None,
+    location: Optional[str] = None
+) -> Dict[str, Any]:
+    """Build an event resource for events().insert() (Google Calendar API format)."""
+    event: Dict[str, Any] = {
+        'summary': summary,
+        'description': description or f'Reminder: {summary}',
+        **_event_times(start_datetime, duration_minutes),
+        'reminders': {
+            'useDefault': False,
+            'overrides': [
+                {'method': 'popup', 'minutes': 10},  # 10 min before popup
+            ],
+        },
+    }
+
+    # Add location if provided
+    if location:
+        event['location'] = location
+
+    return event
+
+
+def _build_event_patch(
+    summary: Optional[str] = None,
+    start_datetime: Optional[datetime] = None,
+    description: Optional[str] = None
+) -> Dict[str, Any]:
+    """Build a partial event body for events().patch() with only the provided fields."""
+    patch: Dict[str, Any] = {}
+    if summary:
+        patch['summary'] = summary
+    if description:
+        patch['description'] = description
+    if start_datetime:
+        patch.update(_event_times(start_datetime, 30))
+    return patch
 
 
 def create_calendar_event(
@@ -179,54 +355,16 @@ def create_calendar_event(
     - Error handling: catches HttpError for API failures
     - Rate limiting: Google Calendar has 1M queries/day quota
     """
+    # Build event object up front - pure, so it needs no error handling
+    event = _build_event_body(summary, start_datetime, duration_minutes, description, location)
+
     try:
         service = get_calendar_service()
 
-        # Calculate end time
-        end_datetime = start_datetime + timedelta(minutes=duration_minutes)
-
-        # Get timezone name (handle both pytz and zoneinfo)
-        def get_timezone_name(dt: datetime) -> str:
-            """Extract timezone name from datetime object."""
-            if dt.tzinfo is None:
-                return 'UTC'
-            # Try to get zone attribute (works for some timezone objects)
-            if hasattr(dt.tzinfo, 'zone'):
-                return dt.tzinfo.zone
-            # Fallback: use tzname() method (works for pytz StaticTzInfo)
-            tzname = dt.tzinfo.tzname(dt)
-            if tzname:
-                return tzname
-            # Last resort
-            return 'UTC'
-
-        # Build event object (Google Calendar API format)
-        event = {
-            'summary': summary,
-            'description': description or f'Reminder: {summary}',
-            'start': {
-                'dateTime': start_datetime.isoformat(),
-                'timeZone': get_timezone_name(start_datetime),
-            },
-            'end': {
-                'dateTime': end_datetime.isoformat(),
-                'timeZone': get_timezone_name(end_datetime),
-            },
-            'reminders': {
-                'useDefault': False,
-                'overrides': [
-                    {'method': 'popup', 'minutes': 10},  # 10 min before popup
-                ],
-            },
-        }
-
-        # Add location if provided
-        if location:
-            event['location'] = location
-
         # Create the event
         calendar_id = os.getenv('GOOGLE_CALENDAR_ID', 'primary')
         result = service.events().insert(calendarId=calendar_id, body=event).execute()
+        _clear_events_cache()
 
         # Return the event ID (for tracking/syncing)
         return result.get('id')
@@ -235,15 +373,14 @@ def create_calendar_event(
         # Credentials not set up
         raise e
 
-    except HttpError as e:
+    except _http_error() as e:
         # Google API error (rate limit, network, etc.)
-        error_msg = f"Google Calendar API error: {e}"
-        print(f"❌ {error_msg}")
+        logger.exception(f"Google Calendar API error: {e}")
         return None
 
     except Exception as e:
         # Other errors (serialization, network, etc.)
-        print(f"❌ Error creating calendar event: {str(e)}")
+        logger.error(f"Error creating calendar event: {e}")
         return None
 
 
@@ -266,17 +403,19 @@ def delete_calendar_event(event_id: str) -> bool:
         service = get_calendar_service()
         calendar_id = os.getenv('GOOGLE_CALENDAR_ID', 'primary')
         service.events().delete(calendarId=calendar_id, eventId=event_id).execute()
+        _clear_events_cache()
         return True
 
-    except HttpError as e:
+    except _http_error() as e:
         if e.resp.status == 404:
             # Event already deleted or doesn't exist
+            _clear_events_cache()
             return True
-        print(f"❌ Error deleting calendar event: {e}")
+        logger.exception(f"Error deleting calendar event: {e}")
         return False
 
     except Exception as e:
-        print(f"❌ Error deleting calendar event: {str(e)}")
+        logger.error(f"Error deleting calendar event: {e}")
         return False
 
 
@@ -300,56 +439,48 @@ def update_calendar_event(
 
     Interview Notes:
     - Partial updates: only update provided fields
-    - Fetch-modify-update pattern to preserve other fields
+    - PATCH merges the partial body server-side, so other fields are preserved
+      without a separate fetch (one API call instead of two)
     - Used when task description or time changes
     """
-    def get_timezone_name(dt: datetime) -> str:
-        """Extract timezone name from datetime object."""
-        if dt.tzinfo is None:
-            return 'UTC'
-        if hasattr(dt.tzinfo, 'zone'):
-            return dt.tzinfo.zone
-        tzname = dt.tzinfo.tzname(dt)
-        if tzname:
-            return tzname
-        return 'UTC'
+    # Build a partial body with only the provided fields
+    patch = _build_event_patch(summary, start_datetime, description)
 
     try:
         service = get_calendar_service()
         calendar_id = os.getenv('GOOGLE_CALENDAR_ID', 'primary')
 
-        # First, get the current event
-        event = service.events().get(calendarId=calendar_id, eventId=event_id).execute()
-
-        # Update only the provided fields
-        if summary:
-            event['summary'] = summary
-        if description:
-            event['description'] = description
-        if start_datetime:
-            end_datetime = start_datetime + timedelta(minutes=30)
-            event['start'] = {
-                'dateTime': start_datetime.isoformat(),
-                'timeZone': get_timezone_name(start_datetime),
-            }
-            event['end'] = {
-                'dateTime': end_datetime.isoformat(),
-                'timeZone': get_timezone_name(end_datetime),
-            }
-
-        # Update the event
-        service.events().update(calendarId=calendar_id, eventId=event_id, body=event).execute()
+        # Patch the event (server merges the provided fields)
+        service.events().patch(calendarId=calendar_id, eventId=event_id, body=patch).execute()
+        _clear_events_cache()
         return True
 
-    except HttpError as e:
-        print(f"❌ Error updating calendar event: {e}")
+    except _http_error() as e:
+        logger.exception(f"Error updating calendar event: {e}")
         return False
 
     except Exception as e:
-        print(f"❌ Error updating calendar event: {str(e)}")
+        logger.error(f"Error updating calendar event: {e}")
         return False
 
 
+def _format_event(event: Dict[str, Any]) -> Dict[str, Any]:
+    """Flatten a Calendar API event resource into the dict returned by list_calendar_events."""
+    # Start/end carry 'dateTime', or 'date' for all-day events
+    start = event.get('start') or {}
+    end = event.get('end') or {}
+    get = event.get
+    return {
+        'id': get('id'),
+        'summary': get('summary', '(No title)'),
+        'start': start.get('dateTime') or start.get('date'),
+        'end': end.get('dateTime') or end.get('date'),
+        'description': get('description', ''),
+        'location': get('location', ''),
+        'all_day': 'date' in start  # True if all-day event
+    }
+
+
 def list_calendar_events(
     time_min: datetime,
     time_max: datetime,
@@ -375,17 +506,21 @@ def list_calendar_events(
         >>> for event in events:
         ...     print(f"{event['summary']} at {event['start']}")
     """
-    from typing import List, Dict, Any
-
     try:
-        service = get_calendar_service()
-
         # Convert datetime to RFC3339 format for API
-        time_min_str = time_min.isoformat() + 'Z' if time_min.tzinfo is None else time_min.isoformat()
-        time_max_str = time_max.isoformat() + 'Z' if time_max.tzinfo is None else time_max.isoformat()
+        time_min_str = _rfc3339(time_min)
+        time_max_str = _rfc3339(time_max)
+        calendar_id = os.getenv('GOOGLE_CALENDAR_ID', 'primary')
+
+        # Serve repeated queries from the short-lived cache
+        cache_key = (calendar_id, time_min_str, time_max_str, max_results)
+        with _events_cache_lock:
+            cached = _events_cache.get(cache_key)
+        if cached and cached[0] > time.monotonic():
+            return list(cached[1])
 
         # Call Google Calendar API
-        calendar_id = os.getenv('GOOGLE_CALENDAR_ID', 'primary')
+        service = get_calendar_service()
         events_result = service.events().list(
             calendarId=calendar_id,
             timeMin=time_min_str,
@@ -398,37 +533,25 @@ def list_calendar_events(
         events = events_result.get('items', [])
 
         # Parse and format events
-        formatted_events = []
-        for event in events:
-            # Extract start time (could be dateTime or date for all-day events)
-            start = event.get('start', {})
-            start_time = start.get('dateTime', start.get('date'))
-
-            # Extract end time
-            end = event.get('end', {})
-            end_time = end.get('dateTime', end.get('date'))
-
-            formatted_events.append({
-                'id': event.get('id'),
-                'summary': event.get('summary', '(No title)'),
-                'start': start_time,
-                'end': end_time,
-                'description': event.get('description', ''),
-                'location': event.get('location', ''),
-                'all_day': 'date' in start  # True if all-day event
-            })
-
-        return formatted_events
+        formatted_events = [_format_event(event) for event in events]
+
+        with _events_cache_lock:
+            if len(_events_cache) >= EVENTS_CACHE_MAX_ENTRIES:
+                # Evict the oldest entry (dicts keep insertion order)
+                _events_cache.pop(next(iter(_events_cache)))
+            _events_cache[cache_key] = (time.monotonic() + EVENTS_CACHE_TTL_SECONDS, formatted_events)
+
+        return list(formatted_events)
 
     except FileNotFoundError:
         # OAuth credentials not configured
-        print("⚠️ Google Calendar not configured. See docs/GOOGLE_CALENDAR_SETUP.md")
+        logger.warning("Google Calendar not configured. See docs/GOOGLE_CALENDAR_SETUP.md")
         return []
 
-    except HttpError as e:
-        print(f"❌ Google Calendar API error: {e}")
+    except _http_error() as e:
+        logger.exception(f"Google Calendar API error: {e}")
         return []
 
     except Exception as e:
-        print(f"❌ Error listing calendar events: {str(e)}")
+        logger.error(f"Error listing calendar events: {e}")
         return []
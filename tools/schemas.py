@@ -5,8 +5,11 @@ These schemas provide structured outputs for tool calling, ensuring type safety
 and better LLM understanding of tool parameters.
 """
 
-from pydantic import BaseModel, Field, field_validator
-from typing import Optional
+from pydantic import BaseModel, ConfigDict, Field, StringConstraints
+from typing import Annotated, Optional
+
+# Stripped, non-empty string - enforced by pydantic-core instead of a Python validator
+NonEmptyStr = Annotated[str, StringConstraints(strip_whitespace=True, min_length=1)]
 
 
 class CreateReminderInput(BaseModel):
@@ -15,10 +18,12 @@ class CreateReminderInput(BaseModel):
 
     This tool should be used when the user specifies a date/time for their task.
     """
-    task: str = Field(
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
+    task: NonEmptyStr = Field(
         description="The task description to be reminded about (e.g., 'call mom', 'submit report')"
     )
-    when: str = Field(
+    when: NonEmptyStr = Field(
         description="Natural language date/time expression (e.g., 'tomorrow at 10am', 'next Friday 2pm')"
     )
     user_id: str = Field(
@@ -29,20 +34,6 @@ class CreateReminderInput(BaseModel):
         description="Timezone for the reminder (e.g., 'UTC', 'America/New_York')"
     )
 
-    @field_validator('task')
-    def task_not_empty(cls, v):
-        """Ensure task description is not empty."""
-        if not v or not v.strip():
-            raise ValueError("Task description cannot be empty")
-        return v.strip()
-
-    @field_validator('when')
-    def when_not_empty(cls, v):
-        """Ensure date/time is provided."""
-        if not v or not v.strip():
-            raise ValueError("Date/time cannot be empty")
-        return v.strip()
-
 
 class AddTaskInput(BaseModel):
     """
@@ -50,25 +41,22 @@ class AddTaskInput(BaseModel):
 
     Use this for quick tasks that don't need scheduling.
     """
-    task: str = Field(
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
+    task: NonEmptyStr = Field(
         description="The task description to add (e.g., 'buy milk', 'review code')"
     )
     user_id: str = Field(
         description="User identifier (will be auto-injected from context)"
     )
 
-    @field_validator('task')
-    def task_not_empty(cls, v):
-        """Ensure task description is not empty."""
-        if not v or not v.strip():
-            raise ValueError("Task description cannot be empty")
-        return v.strip()
-
 
 class ListTasksInput(BaseModel):
     """
     Input schema for listing all incomplete tasks for a user.
     """
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
     user_id: str = Field(
         description="User identifier (will be auto-injected from context)"
     )
@@ -80,6 +68,8 @@ class MarkTaskDoneInput(BaseModel):
 
     The task_number corresponds to the number shown in the task list.
     """
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
     task_number: int = Field(
         ge=1,
         description="The task number to mark as done (1-indexed, from list_tasks output)"
@@ -88,13 +78,6 @@ class MarkTaskDoneInput(BaseModel):
         description="User identifier (will be auto-injected from context)"
     )
 
-    @field_validator('task_number')
-    def task_number_positive(cls, v):
-        """Ensure task number is positive."""
-        if v < 1:
-            raise ValueError("Task number must be 1 or greater")
-        return v
-
 
 class ClearAllTasksInput(BaseModel):
     """
@@ -102,6 +85,8 @@ class ClearAllTasksInput(BaseModel):
 
     Warning: This operation cannot be undone.
     """
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
     user_id: str = Field(
         description="User identifier (will be auto-injected from context)"
     )
@@ -113,6 +98,8 @@ class ListCalendarEventsInput(BaseModel):
 
     Use this when the user asks about their schedule, calendar, or upcoming events.
     """
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
     time_min: str = Field(
         description="Start date in natural language (e.g., 'today', 'monday', 'this week')",
         examples=["today", "monday", "this week", "tomorrow"]
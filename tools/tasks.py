@@ -5,19 +5,166 @@ These are the functions the LLM can call to manage tasks.
 All tools interact with the database through the TaskRepository.
 """
 
-from typing import Annotated
+import logging
+import re
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from datetime import date, datetime, time, timedelta
+from functools import cache, lru_cache
+from typing import Annotated, Callable, Optional, Tuple
 from langchain_core.tools import InjectedToolArg
 from database.models import TaskRepository
 from utils.date_parser import (
     datetime_to_iso,
     format_datetime_for_display,
     format_datetime_relative,
+    get_timezone,
     iso_to_datetime,
-    is_date_in_past
+    is_date_in_past,
+    parse_natural_language_date
+)
+from tools.google_calendar import (
+    create_calendar_event,
+    delete_calendar_event,
+    list_calendar_events as get_calendar_events
 )
-from tools.google_calendar import create_calendar_event, delete_calendar_event
 from config.settings import DEFAULT_TIMEZONE
 
+logger = logging.getLogger(__name__)
+
+# Fixed response strings
+_NO_TASKS = "You have no tasks! 🎉"
+_NO_TASKS_TO_DONE = "❌ You have no tasks to mark as done."
+_NO_TASKS_TO_CLEAR = "You have no tasks to clear."
+_NO_CALENDAR_EVENTS = "📅 No calendar events found for this time period."
+_PAST_TIME = "❌ That time is in the past! Please specify a future date/time."
+_MISSING_REMINDER_INPUT = "❌ Please provide both a task and a time for the reminder."
+_INVALID_TASK_NUMBER = "❌ Invalid task number. Task numbers start at 1."
+
+# Cheap check for already-ISO timestamps (e.g. one the agent copied back)
+_ISO_RE = re.compile(r'\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}')
+
+# Background pool for Google Calendar calls, so tool replies don't wait on
+# the HTTP round-trip. Each worker thread builds its own calendar service.
+_CAL_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="calendar")
+
+# How long create_reminder waits for the calendar event before replying
+_CALENDAR_CREATE_TIMEOUT_SECONDS = 10
+
+
+@cache
+def _repo() -> TaskRepository:
+    """
+    Return the shared TaskRepository, creating it on first use.
+
+    Built lazily rather than at import time so that importing this module
+    (e.g. in a forked worker) does no database I/O. TaskRepository keeps one
+    long-lived connection per thread (thread-local, opened on first use), so
+    one instance is safe to share across threads; call its close() to release
+    the current thread's connection.
+    """
+    return TaskRepository()
+
+
+def _parse_when(when: str, timezone: str) -> Optional[datetime]:
+    """
+    Parse a reminder time, skipping natural-language parsing for ISO input.
+
+    ISO timestamps go straight to fromisoformat: naive ones are localized to
+    the user's timezone and ones with an offset are converted to it, as
+    dateparser's TO_TIMEZONE would. Anything else (or malformed ISO) falls
+    back to parse_natural_language_date.
+    """
+    if _ISO_RE.match(when):
+        try:
+            parsed = iso_to_datetime(when)
+        except ValueError:
+            pass
+        else:
+            if parsed.tzinfo is None:
+                return parsed.replace(tzinfo=get_timezone(timezone))
+            return parsed.astimezone(get_timezone(timezone))
+
+    return parse_natural_language_date(when, timezone)
+
+
+@lru_cache(maxsize=1024)
+def _parse_due(due_date: str) -> datetime:
+    """
+    Parse a stored due date, memoized across listings.
+
+    due_date is always written by datetime_to_iso (no trailing 'Z'), so the
+    C-implemented fromisoformat can parse it directly.
+    """
+    return datetime.fromisoformat(due_date)
+
+
+@lru_cache(maxsize=1024)
+def _format_due(due_date: str, tz: str, today_ordinal: int, overdue: bool) -> str:
+    """
+    Format a stored due date for list_tasks, memoized across listings.
+
+    today_ordinal and overdue are only part of the cache key, so the
+    "Today"/"Tomorrow"/"OVERDUE" wording is recomputed when either changes.
+    """
+    return format_datetime_relative(_parse_due(due_date), tz)
+
+
+@lru_cache(maxsize=32)
+def _week_bounds(timezone: str, today_ordinal: int) -> Tuple[datetime, datetime]:
+    """
+    Default list_calendar_events range: start of today to end of Sunday.
+
+    Keyed by today's ordinal in the user's timezone, so cached bounds roll
+    over at local midnight.
+    """
+    tz = get_timezone(timezone)
+    today = date.fromordinal(today_ordinal)
+    sunday = today + timedelta(days=(6 - today.weekday()) % 7)
+    return datetime.combine(today, time.min, tzinfo=tz), datetime.combine(sunday, time.max, tzinfo=tz)
+
+
+def _delete_calendar_event_quietly(event_id: str) -> bool:
+    """
+    Delete a calendar event in the background, logging instead of raising.
+
+    The task is already updated in the database by the time this runs, so a
+    calendar failure must not surface as a tool error.
+    """
+    try:
+        return delete_calendar_event(event_id)
+    except Exception:
+        logger.exception(f"Failed to delete calendar event {event_id}")
+        return False
+
+
+def _link_late_calendar_event(repo: TaskRepository, task_id: int, user_id: str) -> Callable[[Future], None]:
+    """
+    Build a done-callback that stores a calendar event id arriving after
+    create_reminder stopped waiting, so the event can still be deleted with
+    its task later.
+    """
+    def link(future: Future) -> None:
+        try:
+            calendar_event_id = future.result()
+            if calendar_event_id:
+                repo.update_calendar_event_id(task_id, user_id, calendar_event_id)
+        except Exception:
+            logger.exception(f"Failed to link late calendar event to task {task_id}")
+
+    return link
+
+
+def _discard_calendar_event(future: Future) -> None:
+    """
+    Done-callback that deletes the event a calendar create produced, for
+    when the task it belonged to could not be saved.
+    """
+    if future.cancelled() or future.exception() is not None:
+        return
+    calendar_event_id = future.result()
+    if calendar_event_id:
+        _CAL_EXECUTOR.submit(_delete_calendar_event_quietly, calendar_event_id)
+
 
 def create_reminder(task: str, when: str, user_id: Annotated[str, InjectedToolArg()], timezone: str = DEFAULT_TIMEZONE) -> str:
     """
@@ -40,47 +187,65 @@ def create_reminder(task: str, when: str, user_id: Annotated[str, InjectedToolAr
         "✓ Reminder set: 'call Gabi' for Tuesday, October 28, 2025 at 10:00 AM"
     """
     try:
-        # Create repository instance for this tool call
-        repo = TaskRepository()
+        # Reject obviously bad input before any parsing or I/O
+        if not task.strip() or not when.strip():
+            return _MISSING_REMINDER_INPUT
 
         # Parse the date/time from the 'when' parameter
-        from utils.date_parser import parse_natural_language_date
-
-        parsed_dt = parse_natural_language_date(when, timezone)
+        parsed_dt = _parse_when(when, timezone)
 
         if not parsed_dt:
             return f"❌ Couldn't understand the time '{when}'. Try formats like 'tomorrow at 10am' or 'next Friday 2pm'."
 
         # Check if date is in the past
         if is_date_in_past(parsed_dt):
-            return f"❌ That time is in the past! Please specify a future date/time."
-
-        # Create task in database with due_date
-        task_id = repo.create_task(
-            user_id=user_id,
-            description=task,
-            due_date=datetime_to_iso(parsed_dt),
-            timezone=timezone
-        )
+            return _PAST_TIME
+
+        repo = _repo()
+        display = format_datetime_for_display(parsed_dt)
 
-        # Create calendar event
-        calendar_event_id = create_calendar_event(
+        # Start creating the calendar event; it is independent of the DB insert
+        calendar_future = _CAL_EXECUTOR.submit(
+            create_calendar_event,
             summary=task,
             start_datetime=parsed_dt,
             description=f"Task reminder: {task}"
         )
 
+        # Create task in database with due_date while the API call is in flight
+        try:
+            task_id = repo.create_task(
+                user_id=user_id,
+                description=task,
+                due_date=datetime_to_iso(parsed_dt),
+                timezone=timezone
+            )
+        except Exception:
+            # No task to link the event to: stop the call if it hasn't started,
+            # otherwise remove the event once it has been created
+            if not calendar_future.cancel():
+                calendar_future.add_done_callback(_discard_calendar_event)
+            raise
+
+        try:
+            calendar_event_id = calendar_future.result(timeout=_CALENDAR_CREATE_TIMEOUT_SECONDS)
+        except FutureTimeoutError:
+            # Too slow to wait for - the task is saved, report calendar as not
+            # added, and link the event to the task if it arrives later
+            calendar_future.add_done_callback(_link_late_calendar_event(repo, task_id, user_id))
+            calendar_event_id = None
+
         # If calendar creation succeeded, update task with event ID
         if calendar_event_id:
             repo.update_calendar_event_id(task_id, user_id, calendar_event_id)
             return (
-                f"✓ Reminder set: '{task}' for {format_datetime_for_display(parsed_dt)}\n"
+                f"✓ Reminder set: '{task}' for {display}\n"
                 f"📅 Added to your Google Calendar!"
             )
         else:
             # Calendar creation failed, but task was created
             return (
-                f"✓ Task '{task}' added with reminder for {format_datetime_for_display(parsed_dt)}\n"
+                f"✓ Task '{task}' added with reminder for {display}\n"
                 f"⚠️ Couldn't add to Google Calendar. Check your calendar setup."
             )
 
@@ -109,8 +274,7 @@ def add_task(task: str, user_id: Annotated[str, InjectedToolArg()]) -> str:
         Confirmation message with the task ID
     """
     try:
-        # Create repository instance for this tool call
-        repo = TaskRepository()
+        repo = _repo()
         task_id = repo.create_task(user_id, task)
         return f"✓ Added task #{task_id}: '{task}'"
     except Exception as e:
@@ -128,30 +292,36 @@ def list_tasks(user_id: Annotated[str, InjectedToolArg()]) -> str:
         String representation of all incomplete tasks
     """
     try:
-        # Create repository instance for this tool call
-        repo = TaskRepository()
+        repo = _repo()
         tasks = repo.get_user_tasks(user_id, done=False)
 
         if not tasks:
-            return "You have no tasks! 🎉"
+            return _NO_TASKS
 
-        task_list = "Your tasks:\n"
+        # Collect lines and join once (repeated += on str is quadratic)
+        lines = ["Your tasks:"]
+        # Current time and date per timezone, read once per listing
+        clocks = {}
         for i, task in enumerate(tasks, 1):
-            task_id, description, done, created_at, due_date, calendar_event_id, tz = task
+            description, due_date, tz = task["description"], task["due_date"], task["timezone"] or "UTC"
             # Show due date if available
             if due_date:
                 # Convert ISO string to datetime and format with relative dates
                 try:
-                    dt = iso_to_datetime(due_date)
-                    formatted_date = format_datetime_relative(dt, tz or "UTC")
-                    task_list += f"{i}. {description} (Due: {formatted_date})\n"
+                    clock = clocks.get(tz)
+                    if clock is None:
+                        now = datetime.now(get_timezone(tz))
+                        clock = clocks[tz] = (now, now.toordinal())
+                    now, today_ordinal = clock
+                    formatted_date = _format_due(due_date, tz, today_ordinal, _parse_due(due_date) < now)
+                    lines.append(f"{i}. {description} (Due: {formatted_date})")
                 except Exception:
                     # Fallback to raw date if parsing fails
-                    task_list += f"{i}. {description} (Due: {due_date})\n"
+                    lines.append(f"{i}. {description} (Due: {due_date})")
             else:
-                task_list += f"{i}. {description}\n"
+                lines.append(f"{i}. {description}")
 
-        return task_list.strip()
+        return "\n".join(lines).strip()
     except Exception as e:
         return f"❌ Error listing tasks: {str(e)}"
 
@@ -160,7 +330,8 @@ def mark_task_done(task_number: int, user_id: Annotated[str, InjectedToolArg()])
     """
     Mark a task as completed.
 
-    Also deletes the associated Google Calendar event if one exists.
+    Also deletes the associated Google Calendar event if one exists. The
+    delete runs in the background so the reply doesn't wait on the API.
 
     Args:
         task_number: The number of the task to mark as done (1-indexed, from list_tasks)
@@ -170,44 +341,34 @@ def mark_task_done(task_number: int, user_id: Annotated[str, InjectedToolArg()])
         Confirmation message
     """
     try:
-        # Create repository instance for this tool call
-        repo = TaskRepository()
+        # Task numbers are 1-indexed; reject anything lower without touching the DB
+        if task_number < 1:
+            return _INVALID_TASK_NUMBER
 
-        # Get current tasks to find the actual task ID
-        tasks = repo.get_user_tasks(user_id, done=False)
+        repo = _repo()
 
-        if not tasks:
-            return "❌ You have no tasks to mark as done."
+        # Resolve the task number and mark it done in one statement
+        task = repo.mark_task_done_by_number(user_id, task_number)
 
-        if task_number < 1 or task_number > len(tasks):
-            return f"❌ Invalid task number. You have {len(tasks)} task(s). Please choose a number between 1 and {len(tasks)}."
+        if task is None:
+            # Only count tasks on the error path, to report the valid range
+            task_count = repo.count_user_tasks(user_id, done=False)
 
-        # Unpack all fields (7 fields: id, description, done, created_at, due_date, calendar_event_id, timezone)
-        task_id = tasks[task_number - 1][0]
-        task_description = tasks[task_number - 1][1]
-        calendar_event_id = tasks[task_number - 1][5]  # Index 5 is calendar_event_id
+            if not task_count:
+                return _NO_TASKS_TO_DONE
 
-        # Mark it as done in database
-        success = repo.mark_task_done(task_id, user_id)
+            return f"❌ Invalid task number. You have {task_count} task(s). Please choose a number between 1 and {task_count}."
 
-        if not success:
-            return "❌ Failed to mark task as done."
+        task_description = task["description"]
+        calendar_event_id = task["calendar_event_id"]
 
-        # If task has a calendar event, delete it
-        calendar_deleted = False
+        # If task has a calendar event, delete it without waiting on the API
+        suffix = ""
         if calendar_event_id:
-            try:
-                calendar_deleted = delete_calendar_event(calendar_event_id)
-            except Exception:
-                # Calendar deletion failed, but task is marked done - that's OK
-                pass
-
-        # Build response message
-        message = f"✓ Marked task #{task_number} as done: '{task_description}'"
-        if calendar_deleted:
-            message += "\n📅 Removed from Google Calendar"
+            _CAL_EXECUTOR.submit(_delete_calendar_event_quietly, calendar_event_id)
+            suffix = "\n📅 Removing from Google Calendar"
 
-        return message
+        return f"✓ Marked task #{task_number} as done: '{task_description}'{suffix}"
 
     except Exception as e:
         return f"❌ Error marking task as done: {str(e)}"
@@ -230,31 +391,33 @@ def clear_all_tasks(user_id: Annotated[str, InjectedToolArg()], confirmed: bool
         Confirmation message with count of deleted tasks, or confirmation prompt
     """
     try:
-        # Create repository instance for this tool call
-        repo = TaskRepository()
+        repo = _repo()
 
         # Check how many tasks exist
-        tasks = repo.get_user_tasks(user_id, done=False)
-        task_count = len(tasks)
+        task_count = repo.count_user_tasks(user_id, done=False)
 
         # If no tasks, no confirmation needed
         if task_count == 0:
-            return "You have no tasks to clear."
+            return _NO_TASKS_TO_CLEAR
 
         # If not confirmed, return confirmation prompt
         if not confirmed:
-            if task_count == 1:
-                return "⚠️ This will delete your 1 task. Are you sure you want to clear it?"
-            else:
-                return f"⚠️ This will delete all {task_count} tasks. Are you sure you want to clear them?"
+            one = task_count == 1
+            return (
+                f"⚠️ This will delete {'your 1 task' if one else f'all {task_count} tasks'}. "
+                f"Are you sure you want to clear {'it' if one else 'them'}?"
+            )
 
-        # User confirmed - proceed with deletion
+        # User confirmed - only scheduled tasks can have calendar events
+        scheduled = repo.get_scheduled_tasks(user_id, done=False)
         count = repo.clear_all_tasks(user_id)
 
-        if count == 1:
-            return "✓ Cleared 1 task!"
-        else:
-            return f"✓ Cleared {count} tasks!"
+        # Remove the cleared tasks' calendar events in parallel, in the background
+        for task in scheduled:
+            if task["calendar_event_id"]:
+                _CAL_EXECUTOR.submit(_delete_calendar_event_quietly, task["calendar_event_id"])
+
+        return f"✓ Cleared {count} task{'' if count == 1 else 's'}!"
     except Exception as e:
         return f"❌ Error clearing tasks: {str(e)}"
 
@@ -282,65 +445,29 @@ def list_calendar_events(time_min: str, time_max: str, user_id: Annotated[str, I
         - Tuesday 2pm: Dentist appointment
         - Wednesday 3pm: Project review"
     """
-    from datetime import datetime, timedelta
-    from utils.date_parser import parse_natural_language_date
-    import pytz
-
     try:
-        # Parse natural language dates
-        tz = pytz.timezone(timezone)
-        now = datetime.now(tz)
+        # Today's date in the user's timezone keys the cached fallback range
+        today_ordinal = datetime.now(get_timezone(timezone)).toordinal()
 
-        # Parse start date
+        # Parse natural language dates
         start_dt = parse_natural_language_date(time_min, timezone)
-        if not start_dt:
-            # Fallback: use today
-            start_dt = now.replace(hour=0, minute=0, second=0, microsecond=0)
-
-        # Parse end date
         end_dt = parse_natural_language_date(time_max, timezone)
-        if not end_dt:
-            # Fallback: use end of week (Sunday 11:59pm)
-            days_until_sunday = (6 - now.weekday()) % 7
-            end_dt = now + timedelta(days=days_until_sunday)
-            end_dt = end_dt.replace(hour=23, minute=59, second=59, microsecond=999999)
+
+        if not start_dt or not end_dt:
+            # Fallback: start of today / end of week (Sunday 11:59pm)
+            week_start, week_end = _week_bounds(timezone, today_ordinal)
+            start_dt = start_dt or week_start
+            end_dt = end_dt or week_end
 
         # Call Google Calendar API
-        from tools.google_calendar import list_calendar_events as get_calendar_events
         events = get_calendar_events(start_dt, end_dt)
 
         if not events:
-            return "📅 No calendar events found for this time period."
-
-        # Format events for display
-        result = f"📅 Your calendar ({len(events)} event{'s' if len(events) != 1 else ''}):\n\n"
-
-        for event in events:
-            summary = event['summary']
-            start_time = event['start']
-            location = event['location']
-
-            # Format start time
-            try:
-                if event.get('all_day'):
-                    # All-day event
-                    formatted_time = format_datetime_for_display(iso_to_datetime(start_time))
-                    result += f"• {formatted_time} (All day): {summary}\n"
-                else:
-                    # Regular event with time
-                    start_datetime = iso_to_datetime(start_time)
-                    formatted_time = format_datetime_relative(start_datetime, timezone)
-                    result += f"• {formatted_time}: {summary}\n"
-
-                # Add location if available
-                if location:
-                    result += f"  📍 {location}\n"
-
-            except Exception as parse_error:
-                # Fallback to raw display if parsing fails (preserve location and all-day info)
-                result += _format_calendar_event_fallback(event, timezone)
-
-        return result.strip()
+            return _NO_CALENDAR_EVENTS
+
+        # Format each event as one block and join once
+        header = f"📅 Your calendar ({len(events)} event{'s' if len(events) != 1 else ''}):"
+        return f"{header}\n\n" + "\n".join([_format_calendar_event(event, timezone) for event in events])
 
     except FileNotFoundError:
         return "⚠️  Google Calendar not configured. I can only show tasks from my local database."
@@ -349,6 +476,34 @@ def list_calendar_events(time_min: str, time_max: str, user_id: Annotated[str, I
         return f"❌ Error fetching calendar events: {str(e)}"
 
 
+def _format_calendar_event(event: dict, timezone: str) -> str:
+    """
+    Build the display block for one calendar event in list_calendar_events.
+
+    Timed events use relative dates ("Today at 10:00 AM"); all-day events use
+    the full date. Falls back to the raw timestamp if parsing fails.
+    """
+    summary = event['summary']
+    start_time = event['start']
+    location = event['location']
+
+    # Format start time
+    try:
+        if event.get('all_day'):
+            # All-day event
+            formatted_time = f"{format_datetime_for_display(iso_to_datetime(start_time))} (All day)"
+        else:
+            # Regular event with time
+            formatted_time = format_datetime_relative(iso_to_datetime(start_time), timezone)
+    except Exception:
+        # Fallback to raw display if parsing fails (preserve location and all-day info)
+        return _format_calendar_event_fallback(event, timezone)
+
+    # Add location line if available
+    location_line = f"\n  📍 {location}" if location else ""
+    return f"• {formatted_time}: {summary}{location_line}"
+
+
 def _format_calendar_event_fallback(event: dict, timezone: str) -> str:
     """
     Build a display string for a calendar event when datetime parsing fails.
@@ -362,10 +517,6 @@ def _format_calendar_event_fallback(event: dict, timezone: str) -> str:
     location = event.get('location', '')
     is_all_day = bool(event.get('all_day'))
 
-    line = f"• {start_time}"
-    if is_all_day:
-        line += " (All day)"
-    line += f": {summary}\n"
-    if location:
-        line += f"  📍 {location}\n"
-    return line
+    all_day = " (All day)" if is_all_day else ""
+    location_line = f"\n  📍 {location}" if location else ""
+    return f"• {start_time}{all_day}: {summary}{location_line}"
@@ -11,10 +11,103 @@ Handles phrases like:
 Uses dateparser library for robust, deterministic parsing.
 """
 
+import re
+import sys
+import time
 from datetime import datetime, timedelta
-from typing import Optional, Tuple
-import dateparser
-import pytz
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+from zoneinfo import ZoneInfo
+from dateparser.date import DateDataParser
+
+# Clock time such as "10am" or "2:30 pm". Each step is decided by the next
+# character (digit, ':', whitespace or a/p), so a failed match gives up after
+# a bounded number of retries instead of backtracking over long user input.
+_CLOCK = r'\d{1,2}(?::\d{2})?\s*(?:am|pm)\b'
+
+# Temporal patterns to extract and parse separately in extract_date_from_task.
+# Ordered from most specific to least specific.
+_TEMPORAL_PATTERN_STRINGS = (
+    # Match "tomorrow at 10am", "today at 2pm", etc.
+    r'\b(tomorrow|today|tonight)\s+at\s+' + _CLOCK,
+    # Match "next Friday at 2pm", "next Monday at 10am", etc.
+    r'\bnext\s+(?:monday|tuesday|wednesday|thursday|friday|saturday|sunday)\s+(?:at\s+)?' + _CLOCK,
+    # Match "next week/month/year at time"
+    r'\bnext\s+(?:week|month|year)\s+at\s+' + _CLOCK,
+    # Match "next week/month/year/day" without time
+    r'\bnext\s+(?:week|month|year|monday|tuesday|wednesday|thursday|friday|saturday|sunday)\b',
+    # Match "in 3 hours", "in 2 days", etc.
+    r'\bin\s+\d+\s+(?:minute|minutes|hour|hours|day|days|week|weeks|month|months)\b',
+    # Match standalone times "at 10am", "at 2:30pm"
+    r'\bat\s+' + _CLOCK,
+    # Match just "tomorrow", "today", "tonight"
+    r'\b(tomorrow|today|tonight)\b',
+)
+_TEMPORAL_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in _TEMPORAL_PATTERN_STRINGS)
+
+# All patterns as one alternation: a single scan tells whether any of them can match
+_FUSED_TEMPORAL = re.compile("|".join(f"(?:{pattern})" for pattern in _TEMPORAL_PATTERN_STRINGS), re.IGNORECASE)
+
+# Cheap pre-filter for extract_date_from_task: text with no digit and none of
+# these English date words is treated as having no date at all
+_TEMPORAL_HINT = re.compile(
+    r'\d|\b(?:today|tonight|tomorrow|yesterday|now|noon|midnight|next|last|ago'
+    r'|minutes?|hours?|days?|weeks?|weekend|months?|years?'
+    r'|mon|tues?|wed|thu(?:rs?)?|fri|sat|sun'
+    r'|(?:mon|tues|wednes|thurs|fri|satur|sun)day'
+    r'|jan(?:uary)?|feb(?:ruary)?|mar(?:ch)?|apr(?:il)?|may|june?|july?|aug(?:ust)?'
+    r'|sept?(?:ember)?|oct(?:ober)?|nov(?:ember)?|dec(?:ember)?)\b',
+    re.IGNORECASE
+)
+
+# Substrings of every _TEMPORAL_HINT match (each digit, and a prefix of each
+# word), so lowercase ASCII text containing none of them can't match the hint
+_TEMPORAL_KEYWORDS = tuple("0123456789") + (
+    "tod", "ton", "tom", "yea", "now", "noon", "mid", "nex", "las", "ago",
+    "min", "hou", "day", "wee", "mon", "tue", "wed", "thu", "fri", "sat", "sun",
+    "jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep", "oct", "nov", "dec",
+)
+
+# Runs of whitespace, collapsed to one space when cleaning descriptions
+_WS = re.compile(r'\s+')
+
+# Common phrases parse_natural_language_date answers without dateparser
+# (matched against stripped, lowercased text)
+_RELATIVE_DAY_RE = re.compile(r'(today|tomorrow)(?:\s+at\s+(\d{1,2})(?::(\d{2}))?\s*(am|pm))?')
+_IN_DELTA_RE = re.compile(r'in\s+(\d+)\s+(minute|hour|day|week)s?')
+
+# English names for display formatting, indexed by weekday() / month - 1
+_WEEKDAYS = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
+_MONTH_ABBRS = ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+_MONTHS = (
+    "January", "February", "March", "April", "May", "June",
+    "July", "August", "September", "October", "November", "December",
+)
+
+
+_UTC = ZoneInfo("UTC")
+
+# datetime.fromisoformat accepts a trailing 'Z' from Python 3.11
+_FROMISO_HANDLES_Z = sys.version_info >= (3, 11)
+
+
+def get_timezone(name: str) -> ZoneInfo:
+    """
+    Return the timezone for an IANA name.
+
+    ZoneInfo keeps its own per-key cache, so repeated lookups return the same
+    object without re-reading tzdata.
+
+    Args:
+        name: IANA timezone name (e.g., "Europe/London")
+
+    Returns:
+        ZoneInfo timezone object
+
+    Raises:
+        zoneinfo.ZoneInfoNotFoundError: If the name is not a known timezone
+    """
+    return ZoneInfo(name)
 
 
 def parse_natural_language_date(
@@ -43,16 +136,39 @@ def parse_natural_language_date(
         >>> parse_natural_language_date("in 3 hours")
         datetime(2025, 10, 27, 17, 30, tzinfo=...)
     """
-    # Configure dateparser settings
-    settings = {
-        'PREFER_DATES_FROM': 'future' if prefer_future else 'current_period',
-        'TIMEZONE': timezone,
-        'RETURN_AS_TIMEZONE_AWARE': True,
-        'TO_TIMEZONE': timezone,
-    }
+    # Phrases repeat heavily, so results are memoized. Relative phrases depend
+    # on the current time, so the current minute is part of the cache key.
+    # "today/tomorrow at H" names the same wall time all day, so it is keyed on
+    # the local date instead and only re-parsed once the day rolls over.
+    normalized = text.strip().lower()
+    match = _RELATIVE_DAY_RE.fullmatch(normalized)
+    if match and match.group(2):
+        bucket = datetime.now(get_timezone(timezone)).toordinal()
+    else:
+        bucket = int(time.time() // 60)
+    return _parse_cached(normalized, timezone, prefer_future, bucket)
+
+
+@lru_cache(maxsize=2048)
+def _parse_cached(
+    text: str,
+    timezone: str,
+    prefer_future: bool,
+    bucket: int
+) -> Optional[datetime]:
+    """
+    Parse normalized text with dateparser; memoized by parse_natural_language_date.
+
+    bucket (current minute or local date) is only part of the cache key (see
+    the caller).
+    """
+    parsed_date = _parse_fast_path(text, timezone)
+    if parsed_date is not None:
+        return parsed_date
 
     # Parse the date
-    parsed_date = dateparser.parse(text, settings=settings)  # type: ignore[arg-type]
+    date_data = _date_data_parser(timezone, prefer_future).get_date_data(text)
+    parsed_date = date_data.date_obj if date_data else None
 
     # If parsing failed, return None
     if not parsed_date:
@@ -60,12 +176,72 @@ def parse_natural_language_date(
 
     # Ensure timezone-aware (fallback if dateparser didn't apply it)
     if parsed_date.tzinfo is None:
-        tz = pytz.timezone(timezone)
-        parsed_date = tz.localize(parsed_date)
+        parsed_date = parsed_date.replace(tzinfo=get_timezone(timezone))
 
     return parsed_date
 
 
+@lru_cache(maxsize=32)
+def _date_data_parser(timezone: str, prefer_future: bool) -> DateDataParser:
+    """
+    Return a dateparser parser configured for timezone, built once and reused.
+
+    dateparser.parse() builds a new DateDataParser on every call when custom
+    settings are passed. Pinning the language to English also skips the
+    per-call language detection. The settings dict is only built here, once
+    per (timezone, prefer_future); the bound keeps arbitrary user-supplied
+    timezone names from growing the cache.
+    """
+    settings = {
+        'PREFER_DATES_FROM': 'future' if prefer_future else 'current_period',
+        'TIMEZONE': timezone,
+        'RETURN_AS_TIMEZONE_AWARE': True,
+        'TO_TIMEZONE': timezone,
+    }
+    return DateDataParser(languages=['en'], settings=settings)
+
+
+def _parse_fast_path(text: str, timezone: str) -> Optional[datetime]:
+    """
+    Parse "today"/"tomorrow" (optionally "at H[:MM]am/pm") and "in N minutes/
+    hours/days/weeks" without dateparser.
+
+    Mirrors dateparser's results: relative offsets are added to the current
+    time as elapsed time (in UTC), and "at" times are wall-clock times in the
+    timezone.
+
+    Returns:
+        Timezone-aware datetime, or None if the text isn't one of these forms
+        (the caller then falls back to dateparser)
+    """
+    match = _IN_DELTA_RE.fullmatch(text)
+    if match:
+        amount, unit = match.groups()
+        tz = get_timezone(timezone)
+        try:
+            return (datetime.now(_UTC) + timedelta(**{f"{unit}s": int(amount)})).astimezone(tz)
+        except OverflowError:
+            return None
+
+    match = _RELATIVE_DAY_RE.fullmatch(text)
+    if match:
+        day, hour_text, minute_text, meridiem = match.groups()
+        tz = get_timezone(timezone)
+        now = datetime.now(tz)
+        days = 1 if day == "tomorrow" else 0
+        if hour_text is None:
+            return (now.astimezone(_UTC) + timedelta(days=days)).astimezone(tz)
+
+        hour, minute = int(hour_text), int(minute_text or 0)
+        if not 1 <= hour <= 12 or minute > 59:
+            return None
+        hour = hour % 12 + (12 if meridiem == "pm" else 0)
+        target = now.date() + timedelta(days=days)
+        return datetime(target.year, target.month, target.day, hour, minute, tzinfo=tz)
+
+    return None
+
+
 def extract_date_from_task(
     task_description: str,
     timezone: str = "UTC"
@@ -95,40 +271,27 @@ def extract_date_from_task(
         >>> extract_date_from_task("read book")
         (None, "read book")
     """
-    import re
-
-    # Define temporal patterns to extract and parse separately
-    # Ordered from most specific to least specific
-    temporal_patterns = [
-        # Match "tomorrow at 10am", "today at 2pm", etc.
-        r'\b(tomorrow|today|tonight)\s+at\s+\d{1,2}(?::\d{2})?\s*(?:am|pm)\b',
-        # Match "next Friday at 2pm", "next Monday at 10am", etc.
-        r'\bnext\s+(?:monday|tuesday|wednesday|thursday|friday|saturday|sunday)\s+(?:at\s+)?\d{1,2}(?::\d{2})?\s*(?:am|pm)\b',
-        # Match "next week/month/year at time"
-        r'\bnext\s+(?:week|month|year)\s+at\s+\d{1,2}(?::\d{2})?\s*(?:am|pm)\b',
-        # Match "next week/month/year/day" without time
-        r'\bnext\s+(?:week|month|year|monday|tuesday|wednesday|thursday|friday|saturday|sunday)\b',
-        # Match "in 3 hours", "in 2 days", etc.
-        r'\bin\s+\d+\s+(?:minute|minutes|hour|hours|day|days|week|weeks|month|months)\b',
-        # Match standalone times "at 10am", "at 2:30pm"
-        r'\bat\s+\d{1,2}(?::\d{2})?\s*(?:am|pm)\b',
-        # Match just "tomorrow", "today", "tonight"
-        r'\b(tomorrow|today|tonight)\b',
-    ]
-
-    parsed_date = None
-    temporal_match = None
-
-    # Try each pattern to find temporal expressions
-    for pattern in temporal_patterns:
-        match = re.search(pattern, task_description, re.IGNORECASE)
-        if match:
-            temporal_text = match.group(0)
-            # Try to parse just the temporal portion
-            parsed_date = parse_natural_language_date(temporal_text, timezone)
-            if parsed_date:
-                temporal_match = match
-                break
+    # Most task descriptions have no date at all; skip both the pattern loop
+    # and the whole-text dateparser fallback for them
+    if not _has_temporal_hint(task_description):
+        return None, task_description
+
+    parsed_date: Optional[datetime] = None
+    temporal_match: Optional[re.Match[str]] = None
+
+    # Try each pattern to find temporal expressions. The fused scan rules them
+    # all out in one pass; the ordered loop keeps pattern precedence and lets a
+    # later pattern win when dateparser rejects an earlier match.
+    if _FUSED_TEMPORAL.search(task_description):
+        for pattern in _TEMPORAL_PATTERNS:
+            match = pattern.search(task_description)
+            if match:
+                temporal_text = match.group(0)
+                # Try to parse just the temporal portion
+                parsed_date = parse_natural_language_date(temporal_text, timezone)
+                if parsed_date:
+                    temporal_match = match
+                    break
 
     # If no pattern matched, try parsing the whole text as fallback
     if not parsed_date:
@@ -148,7 +311,7 @@ def extract_date_from_task(
         cleaned = task_description
 
     # Clean up whitespace
-    cleaned = ' '.join(cleaned.split()).strip()
+    cleaned = _WS.sub(' ', cleaned).strip()
 
     # If we removed too much (less than 2 chars left), return original
     if len(cleaned) < 2:
@@ -160,6 +323,48 @@ def extract_date_from_task(
     return parsed_date, cleaned
 
 
+def _has_temporal_hint(text: str) -> bool:
+    """
+    Check whether text might contain a date (see _TEMPORAL_HINT).
+
+    Plain substring checks reject most dateless text several times faster
+    than the regex, which then only runs on the remaining candidates.
+    """
+    lowered = text.lower()
+    if lowered.isascii():
+        for keyword in _TEMPORAL_KEYWORDS:
+            if keyword in lowered:
+                break
+        else:
+            return False
+    return _TEMPORAL_HINT.search(text) is not None
+
+
+def extract_dates_batch(
+    task_descriptions: List[str],
+    timezone: str = "UTC"
+) -> List[Tuple[Optional[datetime], str]]:
+    """
+    Run extract_date_from_task over many descriptions (e.g. for bulk imports).
+
+    Each distinct description is processed once, and temporal phrases shared
+    across descriptions hit parse_natural_language_date's cache, so the cost
+    scales with unique text rather than row count.
+
+    Args:
+        task_descriptions: Task descriptions to process
+        timezone: The timezone to use for interpretation
+
+    Returns:
+        (parsed_datetime, cleaned_description) tuples, in input order
+    """
+    results: Dict[str, Tuple[Optional[datetime], str]] = {}
+    for description in task_descriptions:
+        if description not in results:
+            results[description] = extract_date_from_task(description, timezone)
+    return [results[description] for description in task_descriptions]
+
+
 def is_date_in_past(dt: datetime) -> bool:
     """
     Check if a datetime is in the past.
@@ -174,6 +379,25 @@ def is_date_in_past(dt: datetime) -> bool:
     return dt < now
 
 
+def is_date_in_past_batch(dts: List[datetime]) -> List[bool]:
+    """
+    Check many datetimes against the current time (e.g. to flag overdue tasks).
+
+    Reads the clock once for the whole batch. Aware datetimes compare by
+    instant, so one UTC "now" serves every timezone; naive datetimes are
+    compared against local wall time, as in is_date_in_past.
+
+    Args:
+        dts: Datetime objects, aware or naive
+
+    Returns:
+        True for each datetime that is in the past, in input order
+    """
+    now = datetime.now(_UTC)
+    naive_now = now.astimezone().replace(tzinfo=None)
+    return [dt < (now if dt.tzinfo else naive_now) for dt in dts]
+
+
 def format_datetime_for_display(dt: datetime) -> str:
     """
     Format a datetime for user-friendly display.
@@ -188,7 +412,11 @@ def format_datetime_for_display(dt: datetime) -> str:
         >>> format_datetime_for_display(datetime(2025, 10, 28, 10, 0))
         "Tuesday, October 28, 2025 at 10:00 AM"
     """
-    return dt.strftime("%A, %B %d, %Y at %I:%M %p")
+    # Same output as strftime("%A, %B %d, %Y at %I:%M %p") in the C locale
+    return (
+        f"{_WEEKDAYS[dt.weekday()]}, {_MONTHS[dt.month - 1]} {dt.day:02d}, {dt.year} "
+        f"at {dt.hour % 12 or 12:02d}:{dt.minute:02d} {'AM' if dt.hour < 12 else 'PM'}"
+    )
 
 
 def format_datetime_relative(dt: datetime, timezone: str = "UTC") -> str:
@@ -213,7 +441,7 @@ def format_datetime_relative(dt: datetime, timezone: str = "UTC") -> str:
         "Tomorrow at 10:00 AM"
     """
     # Get current time in the same timezone as dt
-    tz = pytz.timezone(timezone) if timezone else dt.tzinfo
+    tz = get_timezone(timezone) if timezone else dt.tzinfo
     now = datetime.now(tz)
 
     # Check if overdue
@@ -221,12 +449,10 @@ def format_datetime_relative(dt: datetime, timezone: str = "UTC") -> str:
     prefix = "⚠️ OVERDUE: " if is_overdue else ""
 
     # Calculate difference in days (ignoring time)
-    dt_date = dt.date()
-    now_date = now.date()
-    days_diff = (dt_date - now_date).days
+    days_diff = dt.toordinal() - now.toordinal()
 
-    # Format time part
-    time_str = dt.strftime("%I:%M %p").lstrip('0')  # Remove leading zero
+    # Format time part (12-hour clock, no leading zero on the hour)
+    time_str = f"{dt.hour % 12 or 12}:{dt.minute:02d} {'AM' if dt.hour < 12 else 'PM'}"
 
     # Format based on relative date
     if days_diff == 0:
@@ -235,8 +461,7 @@ def format_datetime_relative(dt: datetime, timezone: str = "UTC") -> str:
         return f"{prefix}Tomorrow at {time_str}"
     else:
         # Show day name and short date for near future
-        date_str = dt.strftime("%A, %d %b at")
-        return f"{prefix}{date_str} {time_str}"
+        return f"{prefix}{_WEEKDAYS[dt.weekday()]}, {dt.day:02d} {_MONTH_ABBRS[dt.month - 1]} at {time_str}"
 
 
 def datetime_to_iso(dt: datetime) -> str:
@@ -250,7 +475,7 @@ def datetime_to_iso(dt: datetime) -> str:
         ISO format string
 
     Examples:
-        >>> datetime_to_iso(datetime(2025, 10, 28, 10, 0, tzinfo=pytz.UTC))
+        >>> datetime_to_iso(datetime(2025, 10, 28, 10, 0, tzinfo=ZoneInfo("UTC")))
         "2025-10-28T10:00:00+00:00"
     """
     return dt.isoformat()
@@ -276,8 +501,8 @@ def iso_to_datetime(iso_string: str) -> datetime:
     """
     Convert ISO 8601 format string to datetime object.
 
-    Accepts both timezone-offset formats and trailing 'Z' (UTC) by normalizing
-    to '+00:00' before parsing.
+    Accepts both timezone-offset formats and trailing 'Z' (UTC); before
+    Python 3.11 the 'Z' is normalized to '+00:00' first.
 
     Args:
         iso_string: ISO format datetime string
@@ -291,5 +516,33 @@ def iso_to_datetime(iso_string: str) -> datetime:
         >>> iso_to_datetime("2025-10-28T10:00:00Z")
         datetime(2025, 10, 28, 10, 0, tzinfo=...)
     """
+    if _FROMISO_HANDLES_Z:
+        return datetime.fromisoformat(iso_string.strip())
     normalized = _normalize_iso_utc_z(iso_string)
     return datetime.fromisoformat(normalized)
+
+
+def iso_to_datetime_batch(iso_strings: List[str]) -> List[datetime]:
+    """
+    Convert many ISO 8601 strings to datetime objects (e.g. for bulk imports).
+
+    Same result as calling iso_to_datetime on each string, without the per-item
+    helper calls: 'Z' suffixes are normalized inline before fromisoformat.
+
+    Args:
+        iso_strings: ISO format datetime strings
+
+    Returns:
+        Timezone-aware datetime objects, in input order
+
+    Raises:
+        ValueError: If any string is not valid ISO 8601
+    """
+    fromisoformat = datetime.fromisoformat
+    if _FROMISO_HANDLES_Z:
+        return [fromisoformat(iso_string.strip()) for iso_string in iso_strings]
+    result: List[datetime] = []
+    for iso_string in iso_strings:
+        s = iso_string.strip()
+        result.append(fromisoformat(s[:-1] + "+00:00" if s.endswith("Z") else s))
+    return result